@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+다운샘플링 전후 점 개수 / 페이로드 크기 / 계산 시간 비교
+
+    python benchmarks/bench_downsample.py --symbols 200 --years 20
+
+페이지 하나에는 화면 종류 하나분만 실리므로 크기는 화면 종류별로 비교한다.
+10년 이상 이력에서 어느 화면 종류든 원본보다 작지 않으면 종료 코드 1.
+
+브라우저 그리기 시간은 생성된 페이지를 index.html#perf 로 열면
+updateChart()마다 콘솔에 점 개수와 ms가 찍힌다.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from bench_performance import synthetic_dataset  # noqa: E402
+from series import rebased_series, screen_series  # noqa: E402
+
+
+def count_points(entry):
+    if "values" in entry:
+        return sum(sum(v is not None for v in values) for values in entry["values"].values())
+    return sum(len(points["i"]) for points in entry["sampled"].values())
+
+
+def payload_bytes(series):
+    return len(json.dumps(series["periods"], separators=(",", ":")))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--symbols", type=int, default=200)
+    parser.add_argument("--years", type=float, default=20)
+    parser.add_argument("--method", choices=["lttb", "minmax"], default="lttb")
+    args = parser.parse_args()
+
+    periods = ["1M", "12M", "5Y", f"{int(args.years)}Y"]
+    dataset = synthetic_dataset(args.symbols, args.years)
+
+    start = time.perf_counter()
+    full = rebased_series(dataset, periods, targets=None)
+    full_time = time.perf_counter() - start
+    start = time.perf_counter()
+    sampled = rebased_series(dataset, periods, method=args.method)
+    sampled_time = time.perf_counter() - start
+
+    print(f"심볼 {args.symbols}개 x {args.years:g}년, {args.method}")
+    screens = {screen: screen_series(sampled, screen) for screen in ("mobile", "desktop")}
+    print(f"{'기간':>5} {'원본 점':>10} {'mobile':>10} {'desktop':>10}")
+    for period in periods:
+        raw = count_points(full["periods"][period])
+        mobile = count_points(screens["mobile"]["periods"][period])
+        desktop = count_points(screens["desktop"]["periods"][period])
+        print(f"{period:>5} {raw:>10} {mobile:>10} {desktop:>10}")
+
+    full_bytes = payload_bytes(full)
+    failed = False
+    for screen, series in screens.items():
+        sampled_bytes = payload_bytes(series)
+        print(f"SERIES JSON ({screen}): {full_bytes / 1024:.0f} KB -> {sampled_bytes / 1024:.0f} KB")
+        if args.years >= 10 and sampled_bytes >= full_bytes:
+            print(f"  ❌ {screen}: 다운샘플링이 페이로드를 줄이지 못함")
+            failed = True
+    print(f"계산 시간: 원본 {full_time:.2f}s, 다운샘플 포함 {sampled_time:.2f}s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+수집 방식별 wall-clock 비교 (가짜 provider 사용, 네트워크 없음)
+
+    python benchmarks/bench_fetch.py --symbols 13 --latency 0.2
+    python benchmarks/bench_fetch.py --error-rate 0.2 --slow 1.5
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import fetch_data  # noqa: E402
+from fake_provider import FakeProvider  # noqa: E402
+
+
+def run(mode, symbols, fake, **options):
+    fetch_data.provider = fake
+    fake.calls = 0
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = fetch_data.fetch_all(symbols, mode=mode, **options)
+    elapsed = time.perf_counter() - start
+    ok = sum(1 for prices in results.values() if prices)
+    return elapsed, fake.calls, ok
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--symbols", type=int, default=len(fetch_data.ASSETS))
+    parser.add_argument("--latency", type=float, default=0.2, help="요청당 지연(초)")
+    parser.add_argument("--fail", type=int, default=1, help="실패시킬 심볼 수")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="요청당 일시적 오류 확률")
+    parser.add_argument("--slow", type=float, default=0.0, help="마지막 심볼에 더할 지연(초)")
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    symbols = list(fetch_data.ASSETS)[:args.symbols]
+    symbols += [f"FAKE{i:04d}=X" for i in range(args.symbols - len(symbols))]
+    fake = FakeProvider(latency=args.latency, failing=symbols[:args.fail],
+                      error_rate=args.error_rate, slow={symbols[-1]: args.slow})
+    concurrent = {"workers": args.workers, "backoff": 0.05, "error_budget": len(symbols)}
+
+    print(f"심볼 {len(symbols)}개, 요청당 지연 {args.latency}s, 실패 {args.fail}개, "
+          f"오류율 {args.error_rate:.0%}, 최장 지연 +{args.slow}s")
+    for mode in ("serial", "batch", "concurrent"):
+        options = concurrent if mode == "concurrent" else {}
+        elapsed, calls, ok = run(mode, symbols, fake, **options)
+        print(f"  {mode:10} {elapsed:7.2f}s  요청 {calls:3}회  성공 {ok}/{len(symbols)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+수익률 계산: 심볼별 파이썬 루프(calculate_performance) vs 벡터화 엔진(compute_performance)
+
+    python benchmarks/bench_performance.py --symbols 13 200 2000 --years 1 10 30
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from fetch_data import calculate_performance, get_date_ranges  # noqa: E402
+from performance import compute_performance, period_returns, price_matrix, resolve_period  # noqa: E402
+from store import price_records  # noqa: E402
+
+
+def synthetic_dataset(n_symbols, years, seed=0):
+    """영업일 축 + 랜덤워크 가격, 5% 정도는 빈 날(null)"""
+    rng = np.random.default_rng(seed)
+    end = np.datetime64(datetime.now().date())
+    dates = np.arange(end - int(years * 365), end + 1, dtype="datetime64[D]")
+    dates = dates[np.is_busday(dates)]
+    prices = np.exp(np.cumsum(rng.normal(0, 0.005, (n_symbols, len(dates))), axis=1)).round(4)
+    prices[rng.random(prices.shape) < 0.05] = np.nan
+    return {
+        "dates": [str(d) for d in dates],
+        "assets": {
+            f"SYN{i:04d}=X": {"prices": [None if np.isnan(p) else float(p) for p in row]}
+            for i, row in enumerate(prices)
+        },
+    }
+
+
+def time_scalar(dataset, sample=50):
+    """심볼 sample개만 돌려서 전체 심볼 수로 환산"""
+    date_ranges = get_date_ranges()
+    symbols = list(dataset["assets"])[:sample]
+    records = {symbol: price_records(dataset, symbol) for symbol in symbols}
+    start = time.perf_counter()
+    for symbol in symbols:
+        for start_date in date_ranges.values():
+            calculate_performance(records[symbol], start_date)
+    return (time.perf_counter() - start) * len(dataset["assets"]) / len(symbols)
+
+
+def time_vectorized(dataset):
+    """(dataset -> 결과 dict 전체, 행렬이 준비된 뒤 수익률 계산만)"""
+    start = time.perf_counter()
+    compute_performance(dataset)
+    total = time.perf_counter() - start
+
+    dates, _, matrix = price_matrix(dataset)
+    starts = [resolve_period(period) for period in get_date_ranges()]
+    start = time.perf_counter()
+    period_returns(dates, matrix, starts)
+    return total, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--symbols", type=int, nargs="+", default=[13, 200, 2000])
+    parser.add_argument("--years", type=float, nargs="+", default=[1, 10, 30])
+    args = parser.parse_args()
+
+    print(f"{'심볼':>6} {'년':>4} {'봉':>7} {'루프(s)':>10} {'벡터(s)':>10} {'계산만(s)':>10} {'배수':>7}")
+    for n_symbols in args.symbols:
+        for years in args.years:
+            dataset = synthetic_dataset(n_symbols, years)
+            scalar = time_scalar(dataset)
+            vectorized, kernel = time_vectorized(dataset)
+            print(f"{n_symbols:>6} {years:>4g} {len(dataset['dates']):>7} "
+                  f"{scalar:>10.4f} {vectorized:>10.4f} {kernel:>10.4f} {scalar / vectorized:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+페이지 렌더링 처리량 (renders/sec)
+
+시계열 계산은 한 번만 하고, 컴파일된 템플릿으로 같은 데이터를 반복 렌더링한다.
+
+    python benchmarks/bench_render.py --data data/performance.json --seconds 3
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from generate_html import DATA_PATH, fill_derived_blocks, render_page  # noqa: E402
+from series import rebased_series  # noqa: E402
+from store import load_dataset  # noqa: E402
+from template import load_template  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--data", type=Path, default=DATA_PATH)
+    parser.add_argument("--seconds", type=float, default=3)
+    args = parser.parse_args()
+
+    data = fill_derived_blocks(load_dataset(args.data))
+    series = rebased_series(data)
+
+    start = time.perf_counter()
+    load_template("index.html")
+    print(f"템플릿 컴파일: {(time.perf_counter() - start) * 1000:.2f}ms (최초 1회)")
+
+    for label, kwargs in (("시계열 포함", {"series": series}),
+                          ("외부 데이터", {"series_files": {"YTD": "data/series/YTD.x.json"}})):
+        count = 0
+        start = time.perf_counter()
+        while time.perf_counter() - start < args.seconds:
+            html = render_page(data, **kwargs)
+            count += 1
+        elapsed = time.perf_counter() - start
+        print(f"{label}: {count / elapsed:,.0f} renders/sec ({len(html) / 1024:.0f} KB/page)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+파이프라인 단계별 벤치마크 모음 (합성 데이터, 네트워크 없음)
+
+규모(통화쌍 수 x 년수)마다 단계별 시간을 재서 JSON으로 남긴다.
+브랜치끼리 결과 파일을 비교해 느려진 단계를 잡는 용도.
+
+    fetch                 가짜 provider로 fetch_currency_data (수신 + 변환)   [표본 심볼, 전체로 환산]
+    to_prices             history_to_prices (DataFrame -> [{date, price}])   [표본 심볼, 전체로 환산]
+    calculate_performance 심볼별 파이썬 루프 기준 구현                          [표본 심볼, 전체로 환산]
+    compute_performance   벡터화 엔진, 전체
+    json_write            write_dataset (메모리의 dataset을 심볼별 한 줄씩 직렬화 + 쓰기), 전체
+    json_read             load_dataset (한 줄씩 스트리밍 읽기 + 스키마 검증), 전체
+                          빠른 코덱(msgspec/orjson)이 있으면 표준 json으로도 재서 배수를 같이 남긴다
+    generate_html         generate_html 전체 (+ 내부 단계, 출력 크기)
+
+    python benchmarks/bench_suite.py                               # 13/200/2000쌍 x 1/10/30년
+    python benchmarks/bench_suite.py --pairs 13 200 --years 1 --output /tmp/a.json
+    python benchmarks/bench_suite.py --compare /tmp/main.json      # 20% 넘게 느려진 단계가 있으면 종료 코드 1
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import fetch_data  # noqa: E402
+import render_cache  # noqa: E402
+import schema  # noqa: E402
+from bench_performance import synthetic_dataset, time_scalar  # noqa: E402
+from fake_provider import FakeProvider, synthetic_history  # noqa: E402
+from generate_html import generate_html  # noqa: E402
+from metrics import Metrics  # noqa: E402
+from performance import compute_performance  # noqa: E402
+from store import load_dataset, write_dataset  # noqa: E402
+
+DEFAULT_OUTPUT = ROOT / ".cache" / "bench" / "suite.json"
+PALETTE = ["#3b82f6", "#ef4444", "#22c55e", "#f59e0b", "#8b5cf6", "#06b6d4", "#ec4899", "#84cc16"]
+
+
+def _quiet():
+    return contextlib.redirect_stdout(io.StringIO())
+
+
+def _per_symbol(func, symbols, total):
+    """표본 심볼마다 func(symbol)을 돌린 시간을 전체 심볼 수로 환산"""
+    start = time.perf_counter()
+    for symbol in symbols:
+        func(symbol)
+    return (time.perf_counter() - start) * total / len(symbols)
+
+
+def time_fetch(symbols, total, days):
+    fetch_data.provider = FakeProvider(latency=0)
+    fetch_data.response_cache = None
+    with _quiet():
+        return _per_symbol(lambda symbol: fetch_data.fetch_currency_data(symbol, days=days), symbols, total)
+
+
+def time_to_prices(symbols, total, days):
+    end = datetime.now()
+    frames = {symbol: synthetic_history(symbol, end - timedelta(days=days), end) for symbol in symbols}
+    return _per_symbol(lambda symbol: fetch_data.history_to_prices(frames[symbol]), symbols, total)
+
+
+def time_codec(path, dataset):
+    """현재 JSON 코덱으로 write_dataset / load_dataset 시간 -> (쓰기, 읽기)"""
+    start = time.perf_counter()
+    write_dataset(path, dataset)
+    write = time.perf_counter() - start
+    start = time.perf_counter()
+    load_dataset(path)
+    return write, time.perf_counter() - start
+
+
+def bench_scale(n_pairs, years, sample, workdir):
+    dataset = synthetic_dataset(n_pairs, years)
+    for i, (symbol, info) in enumerate(dataset["assets"].items()):
+        info.update(name=symbol.replace("=X", ""), color=PALETTE[i % len(PALETTE)], performance={})
+    dataset.update(format="columnar-v1", lastUpdated=datetime.now().strftime("%Y-%m-%d %H:%M"))
+    symbols = list(dataset["assets"])
+    sampled = symbols[:sample]
+    days = int(years * 365)
+
+    stages = {
+        "fetch": time_fetch(sampled, n_pairs, days),
+        "to_prices": time_to_prices(sampled, n_pairs, days),
+        "calculate_performance": time_scalar(dataset, sample),
+    }
+
+    start = time.perf_counter()
+    performance = compute_performance(dataset)
+    stages["compute_performance"] = time.perf_counter() - start
+    for symbol, perf in performance.items():
+        dataset["assets"][symbol]["performance"] = perf
+
+    data_path = Path(workdir) / f"perf-{n_pairs}-{years:g}.json"
+    stages["json_write"], stages["json_read"] = time_codec(data_path, dataset)
+    codec = {"backend": schema.backend}
+    if schema.backend != "json":
+        previous = schema.use_backend("json")
+        try:
+            codec["json_write"], codec["json_read"] = time_codec(data_path, dataset)
+        finally:
+            schema.use_backend(previous)
+        codec["write_speedup"] = round(codec["json_write"] / stages["json_write"], 2)
+        codec["read_speedup"] = round(codec["json_read"] / stages["json_read"], 2)
+
+    html_path = Path(workdir) / f"index-{n_pairs}-{years:g}.html"
+    metrics = Metrics("generate_html")
+    start = time.perf_counter()
+    with _quiet():
+        generate_html(data_path, html_path, force=True, metrics=metrics)
+    stages["generate_html"] = time.perf_counter() - start
+
+    return {
+        "pairs": n_pairs,
+        "years": years,
+        "bars": len(dataset["dates"]),
+        "sample": len(sampled),
+        "stages": {name: round(seconds, 5) for name, seconds in stages.items()},
+        "generate_html_stages": {stage["name"]: stage["wall"] for stage in metrics.stages},
+        "codec": {key: round(value, 5) if isinstance(value, float) else value for key, value in codec.items()},
+        "json_bytes": data_path.stat().st_size,
+        "html_bytes": html_path.stat().st_size,
+    }
+
+
+def environment():
+    try:
+        rev = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                             capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        rev = None
+    return {
+        "git": rev,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "json_backend": schema.backend,
+        "machine": platform.machine(),
+        "started": datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def compare(results, baseline, tolerance):
+    """기준 결과 대비 단계별 배수 출력 -> 허용치를 넘게 느려진 (규모, 단계) 목록"""
+    base = {(r["pairs"], r["years"]): r for r in baseline["results"]}
+    regressions = []
+    print(f"\n기준: {baseline['environment'].get('git')} ({baseline['environment'].get('started')})")
+    for result in results:
+        old = base.get((result["pairs"], result["years"]))
+        if old is None:
+            continue
+        for name, seconds in result["stages"].items():
+            before = old["stages"].get(name)
+            if not before:
+                continue
+            ratio = seconds / before
+            flag = " ⚠️" if ratio > 1 + tolerance else ""
+            print(f"  {result['pairs']:>5}쌍 {result['years']:>3g}년 {name:22} "
+                  f"{before:9.4f}s -> {seconds:9.4f}s  {ratio:5.2f}x{flag}")
+            if flag:
+                regressions.append((result["pairs"], result["years"], name))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pairs", type=int, nargs="+", default=[13, 200, 2000])
+    parser.add_argument("--years", type=float, nargs="+", default=[1, 10, 30])
+    parser.add_argument("--sample", type=int, default=20, help="심볼별 루프 단계에서 실제로 돌릴 심볼 수")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="결과 JSON 경로")
+    parser.add_argument("--compare", type=Path, default=None, help="비교할 기준 결과 JSON")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="느려짐 허용 비율 (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'쌍':>5} {'년':>4} {'봉':>6} " + " ".join(f"{name:>12}" for name in
+          ["fetch", "to_prices", "calc_perf", "compute", "json_w", "json_r", "html"]) + f" {'HTML':>9}")
+    with tempfile.TemporaryDirectory() as workdir:
+        # 시계열 조각 캐시도 임시 디렉토리로 - 매번 캐시 없는 첫 생성 시간을 잰다
+        render_cache.RENDER_CACHE_DIR = Path(workdir) / "render"
+        for n_pairs in args.pairs:
+            for years in args.years:
+                result = bench_scale(n_pairs, years, args.sample, workdir)
+                results.append(result)
+                print(f"{n_pairs:>5} {years:>4g} {result['bars']:>6} "
+                      + " ".join(f"{seconds:>11.4f}s" for seconds in result["stages"].values())
+                      + f" {result['html_bytes'] / 1024:>8.0f}K")
+                codec = result["codec"]
+                if "read_speedup" in codec:
+                    print(f"{'':>17} JSON {codec['backend']} / 표준 json: 쓰기 {codec['write_speedup']:.1f}배, "
+                          f"읽기 {codec['read_speedup']:.1f}배 빠름")
+
+    report = {"environment": environment(), "results": results}
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=1)
+    print(f"\n📁 {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print(f"\n⚠️ {len(regressions)}개 단계가 {args.tolerance:.0%} 넘게 느려짐")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
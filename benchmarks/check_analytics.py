@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+분석 지표 회귀 검사: 벡터화 엔진 결과를 심볼별 pandas 계산과 비교
+
+각 심볼의 실제 가격만(빈 날 제외) pandas Series로 놓고 기간마다 따로 계산한 값과
+compute_risk / compute_correlation 결과가 반올림 오차 안에서 같은지 본다. 다르면 종료 코드 1.
+
+    python benchmarks/check_analytics.py --data data/performance.json
+    python benchmarks/check_analytics.py --symbols 50 --years 12
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from alignment import price_matrix  # noqa: E402
+from bench_performance import synthetic_dataset  # noqa: E402
+from correlation import MIN_OBSERVATIONS, compute_correlation  # noqa: E402
+from performance import DEFAULT_PERIODS, resolve_period  # noqa: E402
+from risk import TRADING_DAYS, compute_risk  # noqa: E402
+from store import load_dataset  # noqa: E402
+
+TOLERANCE = 0.011  # 결과는 소수 둘째 자리 반올림
+CORRELATION_TOLERANCE = 0.0011  # 상관계수는 소수 셋째 자리
+
+
+def symbol_series(dataset):
+    """심볼 -> 실제 가격만 남긴 pandas Series (날짜 인덱스)"""
+    dates, symbols, matrix = price_matrix(dataset)
+    index = pd.DatetimeIndex(dates)
+    return {symbol: pd.Series(row, index=index).dropna() for symbol, row in zip(symbols, matrix)}
+
+
+def reference_risk(prices, start):
+    """start 이후 첫 가격부터의 (변동성 %, ratio, 낙폭 %, 고점일, 저점일)"""
+    window = prices[prices.index >= pd.Timestamp(start)]
+    returns = np.log(window).diff().dropna()
+    std = returns.std()
+    vol = std * np.sqrt(TRADING_DAYS) * 100
+    ratio = returns.mean() / std * np.sqrt(TRADING_DAYS)
+    if window.empty:
+        return vol, ratio, np.nan, None, None
+    drawdown = window / window.cummax() - 1
+    trough = drawdown.idxmin()
+    before = window[:trough]
+    peak = before[before == before.max()].index[-1]
+    return vol, ratio, drawdown[trough] * 100, peak, trough
+
+
+def _close(actual, expected, tolerance=TOLERANCE):
+    if actual is None or not np.isfinite(expected):
+        return actual is None and not np.isfinite(expected)
+    return abs(actual - expected) <= tolerance
+
+
+def _day(value):
+    return None if value is None else str(value.date())
+
+
+def check_risk(dataset, periods=DEFAULT_PERIODS):
+    """불일치 목록 [(심볼, 기간, 항목, 엔진 값, pandas 값)]"""
+    risk = compute_risk(dataset, periods)
+    mismatches = []
+    for symbol, prices in symbol_series(dataset).items():
+        for period in periods:
+            block = risk[symbol]["periods"][str(period)]
+            vol, ratio, depth, peak, trough = reference_risk(prices, resolve_period(period))
+            for key, expected in (("vol", vol), ("ratio", ratio), ("maxDrawdown", depth)):
+                if not _close(block[key], expected):
+                    mismatches.append((symbol, period, key, block[key], expected))
+            for key, expected in (("peak", _day(peak)), ("trough", _day(trough))):
+                if block[key] != expected:
+                    mismatches.append((symbol, period, key, block[key], expected))
+    return mismatches
+
+
+def check_correlation(dataset, periods=DEFAULT_PERIODS):
+    """기간별 상관계수를 DataFrame.corr(쌍별 완전 관측)와 비교 -> 불일치 목록"""
+    correlation = compute_correlation(dataset, periods)
+    series = symbol_series(dataset)
+    symbols = correlation["symbols"]
+    rows, cols = np.triu_indices(len(symbols), k=1)
+    mismatches = []
+    for period in periods:
+        start = pd.Timestamp(resolve_period(period))
+        returns = pd.DataFrame({
+            symbol: np.log(prices[prices.index >= start]).diff().dropna()
+            for symbol, prices in series.items()
+        }, columns=symbols)
+        expected = returns.corr(min_periods=MIN_OBSERVATIONS).to_numpy()
+        for value, i, j in zip(correlation["periods"][str(period)], rows, cols):
+            if not _close(value, expected[i, j], CORRELATION_TOLERANCE):
+                mismatches.append((f"{symbols[i]}|{symbols[j]}", period, "corr", value, expected[i, j]))
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--data", type=Path, help="검사할 performance.json (없으면 합성 데이터)")
+    parser.add_argument("--symbols", type=int, default=30)
+    parser.add_argument("--years", type=float, default=6)
+    args = parser.parse_args()
+
+    dataset = load_dataset(args.data) if args.data else synthetic_dataset(args.symbols, args.years)
+    failed = False
+    for name, check in (("risk", check_risk), ("correlation", check_correlation)):
+        mismatches = check(dataset)
+        print(f"{name}: {'OK' if not mismatches else f'불일치 {len(mismatches)}건'}")
+        for mismatch in mismatches[:10]:
+            print("  ", *mismatch)
+        failed = failed or bool(mismatches)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""
+벤치마크용 로컬 가짜 provider
+
+네트워크 없이 providers.YFinanceProvider와 같은 history() / download()
+인터페이스로 DataFrame을 돌려주며, 호출당 지연(latency), 느린 꼬리 지연(slow), 간헐적 오류
+(error_rate), 항상 비어 있는 실패 심볼을 흉내낸다.
+"""
+
+import random
+import threading
+import time
+import zlib
+
+import numpy as np
+import pandas as pd
+
+
+def synthetic_history(symbol, start, end, seed=None):
+    """심볼별로 재현 가능한 랜덤워크 OHLC DataFrame 생성"""
+    index = pd.bdate_range(pd.Timestamp(start).normalize(), pd.Timestamp(end).normalize(), name="Date")
+    rng = np.random.default_rng(seed if seed is not None else zlib.crc32(symbol.encode()))
+    base = rng.uniform(0.5, 1500.0)
+    close = base * np.exp(np.cumsum(rng.normal(0, 0.005, len(index))))
+    return pd.DataFrame({
+        "Open": close,
+        "High": close * 1.002,
+        "Low": close * 0.998,
+        "Close": close,
+        "Volume": np.zeros(len(index)),
+    }, index=index)
+
+
+class FakeProvider:
+    """fetch_data.provider 자리에 끼워 넣어 쓰는 가짜 provider"""
+
+    name = "fake"
+    cacheable = False
+
+    def __init__(self, latency=0.2, per_symbol_latency=0.0, failing=(),
+                 error_rate=0.0, slow=None, seed=0):
+        self.latency = latency
+        self.per_symbol_latency = per_symbol_latency
+        self.failing = set(failing)
+        self.error_rate = error_rate
+        self.slow = dict(slow or {})  # {symbol: 추가 지연(초)}
+        self.calls = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _request(self, n_symbols, symbol=None, timeout=None):
+        with self._lock:
+            self.calls += 1
+            flaky = self._random.random() < self.error_rate
+        delay = self.latency + self.per_symbol_latency * n_symbols + self.slow.get(symbol, 0.0)
+        if timeout is not None and delay > timeout:
+            time.sleep(timeout)
+            raise TimeoutError(f"{symbol} 응답 없음 ({timeout}s)")
+        time.sleep(delay)
+        if flaky:
+            raise ConnectionError(f"{symbol} 일시적 오류")
+
+    def assets(self):
+        return None
+
+    def history(self, symbol, start, end, timeout=None):
+        self._request(1, symbol, timeout)
+        if symbol in self.failing:
+            return pd.DataFrame()
+        return synthetic_history(symbol, start, end)
+
+    def download(self, symbols, start, end):
+        symbols = list(symbols)
+        self._request(len(symbols))
+        frames = {
+            symbol: synthetic_history(symbol, start, end)
+            for symbol in symbols if symbol not in self.failing
+        }
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, axis=1)
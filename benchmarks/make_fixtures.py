@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+file provider용 합성 환율 픽스처 생성
+
+    python benchmarks/make_fixtures.py --pairs 500 --years 20 --out /tmp/fx-fixtures
+    FX_PROVIDER=file FX_FIXTURES_DIR=/tmp/fx-fixtures python scripts/fetch_data.py --output /tmp/perf.json
+"""
+
+import argparse
+import json
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from fake_provider import synthetic_history  # noqa: E402
+from fetch_data import ASSETS  # noqa: E402
+
+COLORS = [info["color"] for info in ASSETS.values()]
+
+
+def synthetic_symbols(count):
+    """실제 ASSETS부터 채우고 모자라면 가상 심볼 추가"""
+    symbols = list(ASSETS)[:count]
+    symbols += [f"SYN{i:04d}=X" for i in range(count - len(symbols))]
+    return symbols
+
+
+def make_fixtures(out, pairs, years, fmt="csv"):
+    out.mkdir(parents=True, exist_ok=True)
+    end = datetime.now()
+    start = end - timedelta(days=int(years * 365.25))
+    assets = {}
+    for i, symbol in enumerate(synthetic_symbols(pairs)):
+        frame = synthetic_history(symbol, start, end)
+        frame.index.name = "Date"
+        if fmt == "parquet":
+            frame.to_parquet(out / f"{symbol}.parquet")
+        else:
+            frame.round(6).to_csv(out / f"{symbol}.csv")
+        info = ASSETS.get(symbol, {"name": symbol.replace("=X", ""), "color": COLORS[i % len(COLORS)]})
+        assets[symbol] = info
+    with open(out / "assets.json", "w", encoding="utf-8") as f:
+        json.dump(assets, f, ensure_ascii=False, indent=1)
+    return assets
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pairs", type=int, default=len(ASSETS))
+    parser.add_argument("--years", type=float, default=1)
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("--out", type=Path, required=True)
+    args = parser.parse_args()
+
+    assets = make_fixtures(args.out, args.pairs, args.years, args.format)
+    print(f"✅ {len(assets)}개 픽스처 생성: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
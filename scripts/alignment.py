@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+공통 영업일 달력과 빈 날 처리
+
+심볼마다 거래일이 다르다 (USDTRY와 EURUSD는 휴일이 다름). 모든 심볼을
+마스터 달력(첫 관측일~마지막 관측일의 월~금 영업일 ∪ 실제 관측일) 하나에
+맞춘 배열로 두고, 빈 날은 정책으로 처리한다:
+
+    mask  - NaN(null) 그대로. 수익률/변동성/상관처럼 실제 관측만 써야 하는 계산
+    ffill - 직전 가격으로 채움 (limit일까지). 크로스 환율처럼 여러 심볼을
+            같은 날짜에 맞춰야 하는 계산
+
+날짜 -> 인덱스는 정렬된 달력에서 이진 탐색 (searchsorted) 한 번. 기간 시작일은
+몇 개뿐이라 호출마다 달력 전체 크기의 조회표를 만드는 것보다 훨씬 싸다.
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+
+POLICIES = ("mask", "ffill")
+
+
+def master_calendar(observed):
+    """관측일(ISO 문자열들) -> 마스터 달력 (정렬된 ISO 문자열 리스트)"""
+    observed = set(observed)
+    if not observed:
+        return []
+    day, last = date.fromisoformat(min(observed)), date.fromisoformat(max(observed))
+    calendar = []
+    while day <= last:
+        iso = day.isoformat()
+        if day.weekday() < 5 or iso in observed:
+            calendar.append(iso)
+        day += timedelta(days=1)
+    return calendar
+
+
+def price_matrix(dataset):
+    """컬럼형 dataset -> (날짜 datetime64[D] 배열, 심볼 리스트, float64 [심볼 x 날짜] 행렬, 빈 날은 NaN)"""
+    symbols = list(dataset["assets"])
+    dates = np.array(dataset["dates"], dtype="datetime64[D]")
+    matrix = np.array(
+        [dataset["assets"][symbol]["prices"] for symbol in symbols], dtype=np.float64
+    ).reshape(len(symbols), len(dates))
+    return dates, symbols, matrix
+
+
+def forward_fill(matrix, limit=None):
+    """NaN을 심볼별 직전 유효 가격으로 채우기 (첫 유효 가격 이전, limit일 넘는 공백은 NaN 유지)"""
+    n = matrix.shape[1]
+    positions = np.arange(n)
+    last = np.maximum.accumulate(np.where(np.isnan(matrix), 0, positions), axis=1)
+    filled = np.take_along_axis(matrix, last, axis=1)
+    if limit is not None:
+        filled[positions - last > limit] = np.nan
+    return filled
+
+
+def align(dataset, policy="mask", limit=None):
+    """컬럼형 dataset -> 정책을 적용한 (날짜, 심볼, [심볼 x 날짜] 행렬)"""
+    if policy not in POLICIES:
+        raise ValueError(f"알 수 없는 빈 날 정책: {policy} (가능: {', '.join(POLICIES)})")
+    dates, symbols, matrix = price_matrix(dataset)
+    if policy == "ffill":
+        matrix = forward_fill(matrix, limit)
+    return dates, symbols, matrix
+
+
+def start_indices(dates, starts):
+    """시작일들 -> 달력 인덱스 (그날 이후(포함) 첫 달력 날, 달력 밖 뒤쪽은 len(dates))"""
+    dates = np.asarray(dates, dtype="datetime64[D]")
+    return np.searchsorted(dates, np.array(starts, dtype="datetime64[D]"), side="left")
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+빌드 산출물 최소화 + 사전 압축
+
+정적 호스팅은 <파일>.gz / <파일>.br 이 있으면 그걸 그대로 내려주므로
+최대 압축 레벨로 미리 만들어 둔다. brotli 패키지가 없으면 .br은 건너뛴다.
+"""
+
+import gzip
+import re
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSED_SUFFIXES = (".gz", ".br")
+
+
+def compressed_suffixes():
+    """이 환경에서 write_compressed가 만드는 확장자 (brotli가 없으면 .gz만)"""
+    return COMPRESSED_SUFFIXES if brotli is not None else (".gz",)
+
+
+_BLOCK_COMMENT = re.compile(r"^\s*/\*.*?\*/\s*$", re.M)
+_LINE_COMMENT = re.compile(r"^\s*//.*$", re.M)
+
+
+def minify_html(html):
+    """페이지의 CSS/JS 들여쓰기, 빈 줄, 한 줄짜리 주석 제거
+
+    토크나이저 없이 안전한 것만 지운다: 줄 앞 공백, 줄 전체가 주석인 줄, 빈 줄.
+    줄바꿈은 남겨 두므로 세미콜론 자동 삽입(ASI)에 기대는 JS도 그대로 동작한다.
+    """
+    html = _BLOCK_COMMENT.sub("", html)
+    html = _LINE_COMMENT.sub("", html)
+    return "\n".join(line.strip() for line in html.splitlines() if line.strip())
+
+
+def write_compressed(path):
+    """path 옆에 .gz(레벨 9)와 .br(quality 11) 생성, {확장자: 바이트 수} 반환"""
+    path = Path(path)
+    body = path.read_bytes()
+    sizes = {"": len(body)}
+    # mtime=0: 내용이 같으면 .gz도 바이트 단위로 같게 (불필요한 diff 방지)
+    gz = gzip.compress(body, compresslevel=9, mtime=0)
+    Path(f"{path}.gz").write_bytes(gz)
+    sizes[".gz"] = len(gz)
+    if brotli is not None:
+        br = brotli.compress(body, quality=11)
+        Path(f"{path}.br").write_bytes(br)
+        sizes[".br"] = len(br)
+    return sizes
+
+
+def print_size_report(rows):
+    """rows: [(이름, 원본 바이트, {확장자: 바이트})]"""
+    print(f"\n📦 {'파일':<32} {'원본':>9} {'최소화':>9} {'gzip':>9} {'brotli':>9}")
+    for name, original, sizes in rows:
+        cells = [sizes.get(key) for key in ("", ".gz", ".br")]
+        text = " ".join(f"{c / 1024:>8.1f}K" if c is not None else f"{'-':>9}" for c in cells)
+        print(f"   {name:<32} {original / 1024:>8.1f}K {text}")
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+기간별 상관계수 행렬 / 통화쌍 롤링 상관계수
+
+일간 로그수익률 [심볼 x 날짜] 행렬(risk.log_returns)에서 기간마다
+빈 날을 0으로 둔 값 X와 마스크 M의 행렬곱(X @ X.T, X @ M.T, X² @ M.T, M @ M.T)으로
+쌍마다 둘 다 값이 있는 날만의 합/제곱합/곱의 합/관측 수를 구한다.
+평균도 쌍별 공통 관측으로 잡으므로 pandas.DataFrame.corr(쌍별 완전 관측)과 같다.
+기간은 risk.py처럼 심볼마다 시작일 이후 첫 가격이 있는 날(기준일) 다음 수익률부터.
+롤링 상관은 x, y, xy, x², y² 누적합 차이로 윈도우마다 다시 더하지 않는다.
+
+페이지가 O(N²·T) 계산을 하지 않도록 결과만 작게 싣는다:
+
+    "correlation": {"symbols": [...],
+                    "periods": {"YTD": [c01, c02, ..., c12, ...]},   # 대각 위 삼각 (i < j), 소수 셋째 자리
+                    "rolling": {"EURUSD=X|USDJPY=X": {"window": 60, "start": 59, "values": [...]}}}
+
+rolling의 start는 dataset["dates"] 인덱스 (values[k]는 dates[start + k]의 값).
+"""
+
+import numpy as np
+
+from alignment import price_matrix, start_indices
+from performance import DEFAULT_PERIODS, anchor_indices, resolve_period
+from risk import log_returns
+
+ROLLING_WINDOW = 60
+# 롤링 상관을 싣는 통화쌍 (둘 다 있을 때만)
+ROLLING_PAIRS = [
+    ("EURUSD=X", "USDJPY=X"),
+    ("USDKRW=X", "USDJPY=X"),
+    ("USDKRW=X", "USDCNY=X"),
+    ("AUDUSD=X", "NZDUSD=X"),
+]
+# 관측 수가 이보다 적은 쌍은 상관계수 없음(None)
+MIN_OBSERVATIONS = 3
+
+
+def correlation_matrix(returns):
+    """[심볼 x 날짜] 수익률 (빈 날 NaN) -> [심볼 x 심볼] 상관계수 (관측 부족은 NaN)"""
+    valid = ~np.isnan(returns)
+    mask = valid.astype(np.float64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # 상관계수는 이동에 불변 - 심볼 평균을 먼저 빼 두면 아래 뺄셈의 자릿수 손실이 작다
+        mean = np.where(valid, returns, 0.0).sum(axis=1) / valid.sum(axis=1)
+    x = np.where(valid, returns - mean[:, None], 0.0)
+    # [i, j]: 심볼 i와 j가 둘 다 값이 있는 날만의 관측 수 / i의 합 / i의 제곱합 / 곱의 합
+    pairs = mask @ mask.T
+    sx = x @ mask.T
+    sxx = (x * x) @ mask.T
+    sxy = x @ x.T
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cov = sxy - sx * sx.T / pairs
+        var = sxx - sx * sx / pairs
+        corr = cov / np.sqrt(var * var.T)
+    corr[pairs < MIN_OBSERVATIONS] = np.nan
+    return np.clip(corr, -1, 1)
+
+
+def upper_triangle(matrix, digits=3):
+    """대각 위 삼각 (i < j) 행 우선 -> 반올림한 리스트 (NaN은 None)"""
+    values = matrix[np.triu_indices(matrix.shape[0], k=1)]
+    return [None if np.isnan(v) else round(float(v), digits) for v in values]
+
+
+def rolling_correlation(x, y, window=ROLLING_WINDOW):
+    """두 수익률 시계열의 window일 롤링 상관 (윈도우 안 공통 관측이 절반 미만이면 NaN)
+
+    반환 길이는 len(x) - window + 1, k번째 값은 [k, k + window) 구간.
+    """
+    both = ~np.isnan(x) & ~np.isnan(y)
+    x, y = np.where(both, x, 0.0), np.where(both, y, 0.0)
+    sums = [np.concatenate([[0.0], np.cumsum(v)]) for v in (both.astype(np.float64), x, y, x * y, x * x, y * y)]
+    n, sx, sy, sxy, sxx, syy = (s[window:] - s[:-window] for s in sums)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cov = sxy - sx * sy / n
+        corr = cov / np.sqrt((sxx - sx * sx / n) * (syy - sy * sy / n))
+    corr[n < window / 2] = np.nan
+    return np.clip(corr, -1, 1)
+
+
+def compute_correlation(dataset, periods=DEFAULT_PERIODS, today=None,
+                        pairs=ROLLING_PAIRS, window=ROLLING_WINDOW):
+    """컬럼형 dataset -> performance.json의 "correlation" 블록"""
+    dates, symbols, matrix = price_matrix(dataset)
+    returns = log_returns(matrix)
+    starts = start_indices(dates, [resolve_period(period, today) for period in periods])
+    anchors = anchor_indices(matrix, starts)
+    result = {"symbols": symbols, "periods": {}, "rolling": {}}
+    for period, start, anchor in zip(periods, starts, anchors.T):
+        # 기준일 수익률(그 전 가격 대비)은 기간 밖 (risk.py와 같은 기준)
+        before = np.arange(start + 1, len(dates)) <= anchor[:, None]
+        in_period = np.where(before, np.nan, returns[:, start + 1:])
+        result["periods"][str(period)] = upper_triangle(correlation_matrix(in_period))
+
+    position = {symbol: i for i, symbol in enumerate(symbols)}
+    for a, b in pairs:
+        if a not in position or b not in position or len(dates) < window:
+            continue
+        values = rolling_correlation(returns[position[a]], returns[position[b]], window)
+        result["rolling"][f"{a}|{b}"] = {
+            "window": window,
+            "start": window - 1,
+            "values": [None if np.isnan(v) else round(float(v), 3) for v in values],
+        }
+    return result
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+USD 통화쌍에서 크로스 환율 도출
+
+ASSETS는 USD가 한쪽에 낀 통화쌍뿐이다. 통화마다 '1단위가 몇 달러인지'
+(USD 가치)로 정규화하면 (EURUSD는 그대로, USDJPY는 역수) 어떤 크로스든
+
+    X/Y = USD가치[X] / USD가치[Y]
+
+라서 통화쌍을 따로 받아올 필요가 없다. N² 시계열을 미리 만들어 두지 않고,
+performance.json에는 통화별 기간 성장률(N x 기간)만 넣어 두고
+크로스 수익률/시계열은 필요할 때 나눗셈 한 번으로 만든다.
+
+    "crosses": {"currencies": ["USD", "EUR", ...],
+                "growth": {"YTD": [1.0, 1.0412, ...], ...}}
+
+X/Y의 기간 수익률(%) = (growth[X] / growth[Y] - 1) * 100
+"""
+
+import re
+
+import numpy as np
+
+from alignment import align, start_indices
+from performance import DEFAULT_PERIODS, last_valid_index, resolve_period, start_prices
+
+_PAIR = re.compile(r"^([A-Z]{3})([A-Z]{3})=X$")
+
+
+def split_pair(symbol):
+    """'USDKRW=X' -> ('USD', 'KRW'), 통화쌍 형식이 아니면 None"""
+    match = _PAIR.match(symbol)
+    return match.groups() if match else None
+
+
+def usd_legs(dataset, policy="mask"):
+    """컬럼형 dataset -> (날짜, 통화 리스트, [통화 x 날짜] USD 가치 행렬)
+
+    USD 행은 1, USD가 끼지 않은 심볼은 건너뛴다. 같은 통화가 두 번 나오면 앞의 것.
+    policy는 빈 날 처리 (alignment.POLICIES).
+    """
+    dates, symbols, matrix = align(dataset, policy)
+    currencies, rows = ["USD"], [np.ones(len(dates))]
+    for symbol, prices in zip(symbols, matrix):
+        pair = split_pair(symbol)
+        if not pair or "USD" not in pair or pair[0] == pair[1]:
+            continue
+        base, quote = pair
+        currency = quote if base == "USD" else base
+        if currency in currencies:
+            continue
+        with np.errstate(divide="ignore"):
+            rows.append(1 / prices if base == "USD" else prices)
+        currencies.append(currency)
+    return dates, currencies, np.vstack(rows)
+
+
+def cross_growth(dataset, periods=DEFAULT_PERIODS, today=None):
+    """통화별 기간 성장률 (마지막 USD 가치 / 기간 시작 USD 가치) -> performance.json의 "crosses" 블록"""
+    dates, currencies, values = usd_legs(dataset)
+    if len(dates) == 0:
+        growth = np.full((len(currencies), len(periods)), np.nan)
+    else:
+        starts = start_indices(dates, [resolve_period(period, today) for period in periods])
+        start_value = start_prices(values, starts)
+        end_value = values[np.arange(len(currencies)), last_valid_index(values)][:, None]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            growth = end_value / start_value
+    growth[~np.isfinite(growth)] = np.nan
+    return {
+        "currencies": currencies,
+        "growth": {
+            str(period): [None if np.isnan(g) else round(float(g), 6) for g in column]
+            for period, column in zip(periods, growth.T)
+        },
+    }
+
+
+def cross_returns(crosses, period):
+    """크로스 블록 -> 기간 수익률 [X x Y] 행렬 (%, X/Y 기준, 계산 불가는 NaN)
+
+    모든 N x N 크로스를 바깥 나눗셈 한 번으로 만든다.
+    """
+    growth = np.array(crosses["growth"][period], dtype=np.float64)
+    return np.round((growth[:, None] / growth[None, :] - 1) * 100, 2)
+
+
+def cross_series(dataset, base, quote):
+    """base/quote 크로스 시계열 하나 -> {"dates": [...], "prices": [...] (빈 날은 None)}
+
+    두 다리의 휴일이 달라도 끊기지 않게 빈 날은 직전 가격으로 채운다.
+    """
+    dates, currencies, values = usd_legs(dataset, policy="ffill")
+    for currency in (base, quote):
+        if currency not in currencies:
+            raise KeyError(f"USD 통화쌍이 없는 통화: {currency}")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rates = values[currencies.index(base)] / values[currencies.index(quote)]
+    return {
+        "dates": [str(d) for d in dates],
+        "prices": [None if not np.isfinite(r) else round(float(r), 6) for r in rates],
+    }
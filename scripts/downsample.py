@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+차트용 시계열 다운샘플링
+
+긴 기간(수년치 일봉)을 화면 폭에 맞는 점 개수로 줄인다.
+  - lttb_indices: Largest-Triangle-Three-Buckets, 모양을 가장 잘 보존 (기본)
+  - minmax_indices: 구간마다 최솟값/최댓값만 남김, 완전 벡터화라 더 빠름
+
+둘 다 원본에서 고른 인덱스를 돌려주므로 값은 원본 그대로이고
+첫 점과 마지막 점은 항상 포함된다. NaN(빈 날)은 건너뛴다.
+"""
+
+import numpy as np
+
+# 화면 종류별 목표 점 개수 (심볼 하나, 기간 하나 기준)
+TARGET_POINTS = {"mobile": 300, "desktop": 1000}
+
+# 이 기간들은 점이 적으므로 항상 원본 해상도로 보낸다
+FULL_RESOLUTION = ("1W", "1M")
+
+
+def _lttb(y, threshold):
+    n = len(y)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    # 다음 구간 평균점은 선택과 무관하므로 한 번에 계산 (마지막 구간의 다음은 끝점)
+    sums = np.add.reduceat(y[:n - 1], edges[:-1]) if len(edges) > 1 else np.empty(0)
+    sizes = np.diff(edges)
+    avg_x = np.append(edges[1:-1] + (sizes[1:] - 1) / 2, n - 1).tolist()
+    avg_y = np.append(sums[1:] / sizes[1:], y[n - 1]).tolist()
+
+    # 구간 안 후보가 몇 개 안 되므로 파이썬 float 루프가 작은 numpy 연산보다 빠르다
+    ys = y.tolist()
+    selected = [0]
+    a = 0
+    for b in range(threshold - 2):
+        ax, ay = a, ys[a]
+        bx, by = avg_x[b], avg_y[b]
+        best, best_area = edges[b], -1.0
+        for j in range(edges[b], edges[b + 1]):
+            area = abs((ax - bx) * (ys[j] - ay) - (ax - j) * (by - ay))
+            if area > best_area:
+                best, best_area = j, area
+        a = int(best)
+        selected.append(a)
+    selected.append(n - 1)
+    return np.array(selected, dtype=np.int64)
+
+
+def _minmax(y, threshold):
+    n = len(y)
+    n_buckets = max((threshold - 2) // 2, 1)
+    size = -(-(n - 2) // n_buckets)
+    body = y[1:n - 1]
+    padded = np.concatenate([body, np.full(size * n_buckets - len(body), np.nan)]).reshape(n_buckets, size)
+    offsets = np.arange(n_buckets) * size + 1
+    filled = ~np.isnan(padded).all(axis=1)
+    lows = offsets + np.nanargmin(np.where(filled[:, None], padded, 0), axis=1)
+    highs = offsets + np.nanargmax(np.where(filled[:, None], padded, 0), axis=1)
+    picked = np.concatenate([[0], lows[filled], highs[filled], [n - 1]])
+    return np.unique(picked)
+
+
+def _downsample(values, threshold, method):
+    values = np.asarray(values, dtype=np.float64)
+    valid = np.flatnonzero(~np.isnan(values))
+    if len(valid) <= threshold or threshold < 3:
+        return valid
+    return valid[method(values[valid], threshold)]
+
+
+def lttb_indices(values, threshold):
+    """LTTB로 고른 인덱스 (NaN 제외, 오름차순)"""
+    return _downsample(values, threshold, _lttb)
+
+
+def minmax_indices(values, threshold):
+    """구간별 최솟값/최댓값 인덱스 (NaN 제외, 오름차순, 최대 threshold개)"""
+    return _downsample(values, threshold, _minmax)
+
+
+METHODS = {"lttb": lttb_indices, "minmax": minmax_indices}
@@ -3,16 +3,27 @@
 글로벌 환율 성과 데이터 수집 스크립트
 """
 
-import json
+import argparse
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
 
-try:
-    import yfinance as yf
-except ImportError:
-    import subprocess
-    subprocess.check_call(['pip', 'install', 'yfinance', '-q'])
-    import yfinance as yf
+import numpy as np
+
+from correlation import compute_correlation
+from crosses import cross_growth
+from history_store import HistoryStore
+from metrics import METRICS_DIR, Metrics, profiling
+from performance import DEFAULT_PERIODS, compute_performance
+from providers import get_provider
+from response_cache import DEFAULT_CACHE_DIR, ResponseCache
+from risk import compute_risk
+from schema import encode
+from store import build_columnar, load_dataset, price_records, write_dataset
 
 # ============================================
 # 환율 정의 (13개)
@@ -35,6 +46,19 @@ ASSETS = {
 }
 
 
+DATA_PATH = Path(__file__).parent.parent / "data" / "performance.json"
+
+# main()에서 설정하는 가격 provider, 응답 캐시, 계측 (None이면 사용 안 함)
+provider = None
+response_cache = None
+metrics = None
+# 종가 말고 봉마다 같이 남길 필드 (--fields)
+bar_fields = ()
+
+# history DataFrame 컬럼 이름
+BAR_COLUMNS = {"open": "Open", "high": "High", "low": "Low", "close": "Close", "volume": "Volume"}
+
+
 def get_date_ranges():
     """기간별 시작 날짜 계산"""
     today = datetime.now()
@@ -48,28 +72,118 @@ def get_date_ranges():
     }
 
 
-def fetch_currency_data(symbol, days=400):
-    """yfinance로 환율 데이터 가져오기"""
+def bar_arrays(hist, fields=()):
+    """history DataFrame -> (epoch-day int64 배열, {"close": 배열, 필드: 배열})
+
+    컬럼과 인덱스를 배열로 한 번에 꺼낸다 (행마다 Series를 만들지 않음).
+    시간대가 붙은 인덱스는 거래소 현지 날짜 기준. 종가가 없는(NaN) 행은 뺀다.
+    """
+    index = hist.index
+    if getattr(index, "tz", None) is not None:
+        index = index.tz_localize(None)
+    days = index.values.astype("datetime64[D]").astype(np.int64)
+    close = hist["Close"].to_numpy(dtype=np.float64)
+    valid = ~np.isnan(close)
+    columns = {"close": close[valid]}
+    for field in fields:
+        columns[field] = hist[BAR_COLUMNS[field]].to_numpy(dtype=np.float64)[valid]
+    return days[valid], columns
+
+
+def history_to_prices(hist, fields=()):
+    """yfinance history DataFrame을 [{date, price}] 리스트로 변환
+
+    fields(open/high/low/volume)를 주면 봉마다 그 값도 같이 남긴다.
+    날짜 문자열화와 반올림은 배열 전체에 한 번씩만 한다.
+    """
+    if hist.empty:
+        return []
+    days, columns = bar_arrays(hist, fields)
+    dates = np.datetime_as_string(days.astype("datetime64[D]"), unit="D").tolist()
+    prices = np.round(columns["close"], 4).tolist()
+    if not fields:
+        return [{"date": date, "price": price} for date, price in zip(dates, prices)]
+    extra = [
+        (field, columns[field].tolist() if field == "volume" else np.round(columns[field], 4).tolist())
+        for field in fields
+    ]
+    records = []
+    for i, (date, price) in enumerate(zip(dates, prices)):
+        record = {"date": date, "price": price}
+        for field, values in extra:
+            record[field] = values[i]
+        records.append(record)
+    return records
+
+
+def _record(key, **values):
+    if metrics is not None:
+        metrics.record(key, **values)
+
+
+def _frame_bytes(frame):
+    # provider가 전송 바이트를 알려주지 않으므로 받은 DataFrame의 메모리 크기로 대신한다
+    return int(frame.memory_usage(deep=True).sum()) if frame is not None else 0
+
+
+def _timed_history(symbol, start_date, end_date, **kwargs):
+    """provider.history + 심볼별 계측 (수신 벽시계/CPU 시간, 행 수, 바이트)"""
+    wall, cpu = time.perf_counter(), time.thread_time()
+    try:
+        hist = provider.history(symbol, start_date, end_date, **kwargs)
+    except Exception:
+        _record(symbol, wall=time.perf_counter() - wall, cpu=time.thread_time() - cpu, errors=1)
+        raise
+    _record(symbol, wall=time.perf_counter() - wall, cpu=time.thread_time() - cpu,
+            rows=len(hist), bytes=_frame_bytes(hist))
+    return hist
+
+
+def _timed_parse(symbol, hist):
+    """history_to_prices + 파싱 시간 계측"""
+    start = time.perf_counter()
+    data = history_to_prices(hist, bar_fields)
+    _record(symbol, parse=time.perf_counter() - start)
+    return data
+
+
+def _cache_get(symbol, start_date, end_date):
+    """(캐시된 봉, 실제로 받아야 할 시작일) — 캐시로 다 채워지면 시작일은 None"""
+    if response_cache is None:
+        return [], start_date
+    cached, fetch_from = response_cache.get(symbol, start_date, end_date)
+    if fetch_from is None:
+        print(f"  📦 {symbol}: {len(cached)}일 데이터 (캐시)")
+        _record(symbol, cached=1)
+    return cached, fetch_from
+
+
+def _cache_put(symbol, start_date, end_date, prices):
+    if response_cache is not None:
+        response_cache.put(symbol, start_date, end_date, prices)
+
+
+def fetch_currency_data(symbol, days=400, start=None):
+    """provider에서 환율 데이터 가져오기 (start를 주면 그 날짜부터만)"""
+    end_date = datetime.now()
+    start_date = start or end_date - timedelta(days=days)
+    cached, fetch_from = _cache_get(symbol, start_date, end_date)
+    if fetch_from is None:
+        return cached or None
+    
     print(f"  💱 {symbol} 데이터 수집 중...")
     
     try:
-        ticker = yf.Ticker(symbol)
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
+        hist = _timed_history(symbol, fetch_from, end_date)
         
-        hist = ticker.history(start=start_date, end=end_date)
-        
-        if hist.empty:
+        if hist.empty and not cached:
             print(f"  ⚠️ {symbol} 데이터 없음")
             return None
         
-        # 날짜와 종가만 추출
-        data = []
-        for date, row in hist.iterrows():
-            data.append({
-                "date": date.strftime("%Y-%m-%d"),
-                "price": round(row["Close"], 4)
-            })
+        # 날짜와 종가만 추출 (캐시된 마감 봉 뒤에 새로 받은 구간만 붙임)
+        fresh = _timed_parse(symbol, hist)
+        _cache_put(symbol, fetch_from, end_date, fresh)
+        data = cached + fresh
         
         print(f"  ✅ {symbol}: {len(data)}일 데이터")
         return data
@@ -79,8 +193,208 @@ def fetch_currency_data(symbol, days=400):
         return None
 
 
+def _split_batch_frame(frame, symbol):
+    """provider.download 결과(MultiIndex 컬럼)에서 한 심볼의 히스토리만 분리"""
+    if getattr(frame.columns, "nlevels", 1) > 1:
+        if symbol not in frame.columns.get_level_values(0):
+            return None
+        hist = frame[symbol]
+    else:
+        hist = frame
+    
+    if "Close" not in hist.columns:
+        return None
+    # 여러 심볼의 날짜를 합친 인덱스라 휴일이 다른 심볼은 NaN 행이 생김
+    return hist.dropna(subset=["Close"])
+
+
+def fetch_currency_data_batch(symbols, days=400, chunk_size=50, starts=None):
+    """provider.download 한 번(또는 chunk_size 단위 몇 번)으로 여러 환율 데이터 가져오기
+    
+    심볼별 가격 리스트 dict를 반환하며, 실패한 심볼의 값은 None.
+    starts({symbol: datetime})가 있으면 청크 안에서 가장 이른 시작일부터 받는다.
+    """
+    symbols = list(symbols)
+    starts = starts or {}
+    end_date = datetime.now()
+    default_start = end_date - timedelta(days=days)
+    results = {}
+    
+    for i in range(0, len(symbols), chunk_size):
+        chunk = symbols[i:i + chunk_size]
+        cached, fetch_from = {}, {}
+        for symbol in chunk:
+            cached[symbol], fetch_from[symbol] = _cache_get(symbol, starts.get(symbol) or default_start, end_date)
+            if fetch_from[symbol] is None:
+                results[symbol] = cached[symbol] or None
+        chunk = [symbol for symbol in chunk if symbol not in results]
+        if not chunk:
+            continue
+        # 캐시에 마감 봉이 있는 심볼은 그 다음 날부터만 필요하다
+        start_date = min(fetch_from[symbol] for symbol in chunk)
+        print(f"  💱 {len(chunk)}개 환율 일괄 수집 중...")
+        
+        key = f"download[{i}:{i + len(chunk)}]"
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            frame = provider.download(chunk, start_date, end_date)
+        except Exception as e:
+            _record(key, wall=time.perf_counter() - wall, cpu=time.thread_time() - cpu, errors=1)
+            print(f"  ❌ 일괄 수집 오류: {e}")
+            for symbol in chunk:
+                results[symbol] = None
+            continue
+        _record(key, wall=time.perf_counter() - wall, cpu=time.thread_time() - cpu, bytes=_frame_bytes(frame))
+        
+        for symbol in chunk:
+            hist = None if frame is None or frame.empty else _split_batch_frame(frame, symbol)
+            if (hist is None or hist.empty) and not cached[symbol]:
+                print(f"  ⚠️ {symbol} 데이터 없음")
+                results[symbol] = None
+                continue
+            
+            fresh = []
+            if hist is not None:
+                _record(symbol, rows=len(hist))
+                # 청크 시작일이 이 심볼보다 이르면 이미 캐시에 있는 날은 버린다
+                since = fetch_from[symbol].strftime("%Y-%m-%d")
+                fresh = [p for p in _timed_parse(symbol, hist) if p["date"] >= since]
+            _cache_put(symbol, fetch_from[symbol], end_date, fresh)
+            results[symbol] = cached[symbol] + fresh
+            print(f"  ✅ {symbol}: {len(results[symbol])}일 데이터")
+    
+    return results
+
+
+class ErrorBudgetExceeded(RuntimeError):
+    """한 번의 실행에서 허용된 실패 횟수를 넘김 (results에 그때까지 끝난 심볼 결과)"""
+
+    def __init__(self, message, results=None):
+        super().__init__(message)
+        self.results = results or {}
+
+
+class ErrorBudget:
+    """스레드 간에 공유하는 실행 단위 실패 예산"""
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def spend(self):
+        """실패 1회 차감, 예산이 남아 있으면 True"""
+        with self._lock:
+            self.used += 1
+            return self.used <= self.limit
+
+
+def fetch_with_retry(symbol, days=400, timeout=10, retries=3, backoff=0.5, budget=None, start=None):
+    """타임아웃 + 지수 백오프(jitter 포함) 재시도로 한 심볼 가져오기
+    
+    실패는 예외 대신 None으로 돌려주며, 실패할 때마다 budget을 차감한다.
+    """
+    end_date = datetime.now()
+    start_date = start or end_date - timedelta(days=days)
+    cached, fetch_from = _cache_get(symbol, start_date, end_date)
+    if fetch_from is None:
+        return cached or None
+    
+    for attempt in range(retries + 1):
+        try:
+            hist = _timed_history(symbol, fetch_from, end_date, timeout=timeout)
+            if hist.empty and not cached:
+                print(f"  ⚠️ {symbol} 데이터 없음")
+                return None
+            fresh = _timed_parse(symbol, hist)
+            _cache_put(symbol, fetch_from, end_date, fresh)
+            data = cached + fresh
+            print(f"  ✅ {symbol}: {len(data)}일 데이터")
+            return data
+        except Exception as e:
+            if budget is not None and not budget.spend():
+                print(f"  ❌ {symbol} 오류 (실패 예산 소진): {e}")
+                return None
+            if attempt == retries:
+                print(f"  ❌ {symbol} 오류 ({retries + 1}회 시도): {e}")
+                return None
+            delay = backoff * (2 ** attempt) * random.uniform(0.5, 1.5)
+            print(f"  🔁 {symbol} 재시도 {attempt + 1}/{retries} ({delay:.1f}s 후): {e}")
+            time.sleep(delay)
+
+
+def fetch_currency_data_concurrent(symbols, days=400, workers=8, timeout=10,
+                                   retries=3, backoff=0.5, error_budget=10, starts=None):
+    """워커 풀로 심볼별 요청을 동시에 보내기
+    
+    전체 소요 시간은 가장 느린 심볼 하나에 맞춰지며, 실행 전체의 실패 횟수가
+    error_budget을 넘으면 남은 요청을 취소하고 ErrorBudgetExceeded를 던진다
+    (예외의 results에 그때까지 끝난 심볼 결과).
+    """
+    budget = ErrorBudget(error_budget)
+    starts = starts or {}
+    results = {}
+    
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(fetch_with_retry, symbol, days, timeout, retries, backoff, budget,
+                        starts.get(symbol)): symbol
+            for symbol in symbols
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+            if budget.used > budget.limit:
+                for pending in futures:
+                    pending.cancel()
+                raise ErrorBudgetExceeded(
+                    f"실패 {budget.used}회로 예산({budget.limit}회) 초과", results
+                )
+    
+    return results
+
+
+def fetch_all(symbols, mode="batch", days=400, starts=None, **options):
+    """수집 모드에 따라 전체 심볼 데이터 가져오기"""
+    if mode == "batch":
+        return fetch_currency_data_batch(symbols, days=days, starts=starts)
+    if mode == "concurrent":
+        return fetch_currency_data_concurrent(symbols, days=days, starts=starts, **options)
+    starts = starts or {}
+    return {symbol: fetch_currency_data(symbol, days=days, start=starts.get(symbol))
+            for symbol in symbols}
+
+
+def load_existing_prices(path):
+    """기존 performance.json(예전/컬럼형 포맷)에서 심볼별 가격 리스트 읽기 (없으면 빈 dict)"""
+    try:
+        dataset = load_dataset(path)
+    except (OSError, ValueError, KeyError):
+        return {}
+    existing = {symbol: price_records(dataset, symbol) for symbol in dataset["assets"]}
+    return {symbol: prices for symbol, prices in existing.items() if prices}
+
+
+def incremental_starts(existing, overlap_days=5):
+    """심볼별 마지막 저장일에서 overlap_days만큼 겹쳐 다시 받을 시작일 계산
+    
+    겹치는 구간은 나중에 수정된 종가를 다시 받아오기 위한 것.
+    """
+    return {
+        symbol: datetime.strptime(prices[-1]["date"], "%Y-%m-%d") - timedelta(days=overlap_days)
+        for symbol, prices in existing.items()
+    }
+
+
+def merge_prices(old, new, retention_days=400):
+    """기존 시계열에 새 봉을 합치고(같은 날짜는 새 값 우선) 보존 기간 밖은 잘라내기"""
+    merged = {p["date"]: p for p in old or []}
+    merged.update((p["date"], p) for p in new or [])
+    cutoff = (datetime.now() - timedelta(days=retention_days)).strftime("%Y-%m-%d")
+    return [merged[date] for date in sorted(merged) if date >= cutoff]
+
+
 def calculate_performance(prices, start_date):
-    """특정 날짜부터의 수익률 계산"""
+    """특정 날짜부터의 수익률 계산 (한 심볼용, 전체 계산은 performance.compute_performance)"""
     start_str = start_date.strftime("%Y-%m-%d")
     
     # 시작 날짜에 가장 가까운 데이터 찾기
@@ -97,46 +411,167 @@ def calculate_performance(prices, start_date):
     return round((end_price - start_price) / start_price * 100, 2)
 
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="글로벌 환율 성과 데이터 수집")
+    parser.add_argument("--mode", choices=["batch", "concurrent", "serial"], default="batch",
+                        help="batch: 일괄 다운로드, concurrent: 워커 풀 동시 수집, serial: 심볼별 순차 수집")
+    parser.add_argument("--workers", type=int, default=8, help="concurrent 모드 워커 수")
+    parser.add_argument("--timeout", type=float, default=10, help="요청당 타임아웃(초)")
+    parser.add_argument("--retries", type=int, default=3, help="요청당 재시도 횟수")
+    parser.add_argument("--error-budget", type=int, default=10, help="실행 전체에서 허용할 실패 횟수")
+    parser.add_argument("--incremental", action="store_true",
+                        help="기존 performance.json 이후 구간만 받아 합치기")
+    parser.add_argument("--overlap", type=int, default=5, help="증분 수집 시 다시 받을 겹침 일수")
+    parser.add_argument("--days", type=int, default=400, help="보존(및 전체 수집) 기간(일)")
+    parser.add_argument("--history", type=Path, default=None,
+                        help="추가 전용 이력 저장소 디렉토리 (새 봉만 덧붙이고 JSON에는 --days 창만)")
+    parser.add_argument("--no-cache", action="store_true", help="응답 캐시를 읽지도 쓰지도 않기")
+    parser.add_argument("--refresh", action="store_true", help="캐시를 무시하고 새로 받아 캐시 갱신")
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR, help="응답 캐시 디렉토리")
+    parser.add_argument("--provider", choices=["yfinance", "file"], default=None,
+                        help="가격 provider (기본: FX_PROVIDER 환경변수, 없으면 yfinance)")
+    parser.add_argument("--fixtures", type=Path, default=None,
+                        help="file provider의 CSV/Parquet 디렉토리 (기본: FX_FIXTURES_DIR)")
+    parser.add_argument("--output", type=Path, default=DATA_PATH, help="결과 JSON 경로")
+    parser.add_argument("--format", choices=["columnar", "legacy"], default="columnar",
+                        help="columnar: 공유 날짜 축 + 심볼별 가격 배열, legacy: 봉마다 {date, price}")
+    parser.add_argument("--binary", action="store_true",
+                        help="columnar 가격 배열을 .f32 사이드카(float32 LE)로 저장")
+    parser.add_argument("--fields", type=lambda value: [f for f in value.split(",") if f], default=[],
+                        help="종가 외에 같이 저장할 봉 필드 (쉼표 구분: open,high,low,volume)")
+    parser.add_argument("--periods", type=lambda value: value.split(","), default=DEFAULT_PERIODS,
+                        help="쉼표로 구분한 수익률 기간 (예: 1W,1M,YTD,MTD,QTD,5Y,2024-01-01)")
+    parser.add_argument("--cache-ttl", type=int, default=15 * 60, help="캐시된 최근 봉(겹침 구간 + 오늘)의 유지 시간(초, 그 전 봉은 만료 없음)")
+    parser.add_argument("--metrics", type=Path, default=METRICS_DIR / "fetch_data.jsonl",
+                        help="단계/심볼별 계측을 한 줄씩 덧붙일 JSON Lines 파일")
+    parser.add_argument("--profile", type=Path, default=None,
+                        help="이 디렉토리에 cProfile(.prof)/tracemalloc 결과 저장")
+    args = parser.parse_args(argv)
+    unknown = set(args.fields) - (set(BAR_COLUMNS) - {"close"})
+    if unknown:
+        parser.error(f"알 수 없는 봉 필드: {', '.join(sorted(unknown))}")
+    return args
+
+
+def run(args):
+    global provider, response_cache, bar_fields
+    provider = get_provider(args.provider, args.fixtures)
+    bar_fields = tuple(args.fields)
+    assets = provider.assets() or ASSETS
+    if not args.no_cache and provider.cacheable:
+        # 필드 구성이 다르면 캐시된 레코드 모양도 다르므로 네임스페이스를 나눈다
+        namespace = "+".join([provider.name, *bar_fields])
+        # 증분 수집이 겹쳐 다시 받는 날은 캐시에서도 마감으로 치지 않는다
+        response_cache = ResponseCache(args.cache_dir, today_ttl=args.cache_ttl, refresh=args.refresh,
+                                       namespace=namespace, overlap_days=args.overlap)
+    
     print("=" * 50)
     print("🚀 글로벌 환율 데이터 수집 시작")
     print(f"📅 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 50)
     
-    date_ranges = get_date_ranges()
     all_data = {}
     
     # 모든 환율 데이터 수집
     print("\n💱 환율 데이터 수집")
-    for symbol, info in ASSETS.items():
-        prices = fetch_currency_data(symbol)
-        if prices:
-            all_data[symbol] = {
-                "name": info["name"],
-                "color": info["color"],
-                "prices": prices,
-                "performance": {}
-            }
-            
-            # 기간별 수익률 계산
-            for period, start_date in date_ranges.items():
-                perf = calculate_performance(prices, start_date)
-                all_data[symbol]["performance"][period] = perf
+    options = {}
+    if args.mode == "concurrent":
+        options = {
+            "workers": args.workers,
+            "timeout": args.timeout,
+            "retries": args.retries,
+            "error_budget": args.error_budget,
+        }
+    store = HistoryStore(args.history) if args.history else None
+    existing = load_existing_prices(args.output) if args.incremental and store is None else {}
+    if existing:
+        print(f"  📂 증분 수집: {len(existing)}개 환율은 마지막 저장일 - {args.overlap}일부터")
+    if store is not None:
+        # 이력 저장소가 있으면 저장소의 마지막 날부터만 받는다
+        starts = store.resume_starts(assets, args.overlap)
+        if starts:
+            print(f"  🗄️ 이력 저장소: {len(starts)}개 환율은 마지막 저장일 - {args.overlap}일부터")
+    else:
+        starts = incremental_starts(existing, args.overlap)
+    budget_exceeded = False
+    with metrics.stage("fetch"):
+        try:
+            fetched = fetch_all(assets.keys(), mode=args.mode, days=args.days, starts=starts, **options)
+        except ErrorBudgetExceeded as e:
+            # 끝난 심볼은 살려서 저장하고, 실행은 실패로 끝낸다
+            print(f"  ❌ {e} - 끝난 심볼만 새로 저장")
+            fetched = e.results
+            budget_exceeded = True
+            if store is None and not existing:
+                # 받지 못한 심볼은 기존 파일의 시계열을 그대로 둔다
+                existing = load_existing_prices(args.output)
+    failed = [symbol for symbol in assets if not fetched.get(symbol)]
+    metrics.count(failed_symbols=len(failed))
+    if store is not None:
+        with metrics.stage("history"):
+            appended = sum(
+                store.append(symbol, fetched.get(symbol), {"name": info["name"], "color": info["color"]})
+                for symbol, info in assets.items()
+            )
+            store.save_index()
+            print(f"  🗄️ 이력 저장소에 새 봉 {appended}개 추가: {store.directory}")
+            # JSON에는 보존 기간 창만 (전체 이력은 저장소에)
+            fetched = store.window(start=(datetime.now() - timedelta(days=args.days)).date(), symbols=list(assets))
+    with metrics.stage("merge"):
+        for symbol, info in assets.items():
+            prices = fetched.get(symbol)
+            if symbol in existing:
+                # 수집에 실패해도 기존 시계열은 유지
+                prices = merge_prices(existing[symbol], prices, args.days)
+            if prices:
+                all_data[symbol] = {
+                    "name": info["name"],
+                    "color": info["color"],
+                    "prices": prices,
+                    "performance": {}
+                }
+        
+        last_updated = datetime.now().strftime("%Y-%m-%d %H:%M")
+        dataset = build_columnar(last_updated, all_data)
+        if args.format == "columnar":
+            # 봉마다 만든 {date, price} dict는 컬럼형으로 옮겼으니 여기서 놓아준다 (가장 큰 중간 구조)
+            del fetched, existing
+            for info in all_data.values():
+                del info["prices"]
     
-    # 결과 저장
-    output = {
-        "lastUpdated": datetime.now().strftime("%Y-%m-%d %H:%M"),
-        "assets": all_data
-    }
+    # 기간별 수익률 계산 (전 심볼 x 전 기간 한 번에)
+    with metrics.stage("performance"):
+        for symbol, perf in compute_performance(dataset, args.periods).items():
+            all_data[symbol]["performance"] = perf
+            dataset["assets"][symbol]["performance"] = perf
+    # 리스크 지표 (변동성/최대 낙폭/수익-변동성 비율)도 같은 행렬에서 한 번에
+    with metrics.stage("risk"):
+        for symbol, risk in compute_risk(dataset, args.periods).items():
+            all_data[symbol]["risk"] = risk
+            dataset["assets"][symbol]["risk"] = risk
+    # 크로스 환율은 시계열 대신 통화별 성장률만 (N² 크로스는 페이지에서 나눗셈으로)
+    with metrics.stage("crosses"):
+        dataset["crosses"] = cross_growth(dataset, args.periods)
+    # 기간별 상관계수 (대각 위 삼각) + 주요 통화쌍 롤링 상관
+    with metrics.stage("correlation"):
+        dataset["correlation"] = compute_correlation(dataset, args.periods)
     
-    output_path = Path(__file__).parent.parent / "data" / "performance.json"
-    output_path.parent.mkdir(exist_ok=True)
+    # 결과 저장
+    output_path = args.output
     
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(output, f, ensure_ascii=False)
+    with metrics.stage("write"):
+        if args.format == "columnar":
+            write_dataset(output_path, dataset, binary=args.binary)
+        else:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write(encode({"lastUpdated": last_updated, "assets": all_data}))
+    metrics.count(output_bytes=output_path.stat().st_size, symbols=len(all_data))
     
     print("\n" + "=" * 50)
     print(f"✅ 완료! {len(all_data)}개 환율 저장됨")
+    if response_cache is not None:
+        print(f"📦 캐시 적중 {response_cache.hits}회 / 부분 적중 {response_cache.partial}회 / 미스 {response_cache.misses}회")
     print(f"📁 {output_path}")
     print("=" * 50)
     
@@ -147,7 +582,23 @@ def main():
         if perf is not None:
             sign = "+" if perf >= 0 else ""
             print(f"  {symbol:12} {data['name']:15} {sign}{perf}%")
+    
+    if failed:
+        print(f"\n⚠️ 이번 실행에서 받지 못한 환율 {len(failed)}개: {', '.join(failed)}")
+    # 실패 예산을 넘긴 실행은 끝난 심볼을 저장한 뒤에도 실패로 끝낸다 (CI에서 보이도록)
+    return 1 if budget_exceeded else 0
+
+
+def main(argv=None):
+    global metrics
+    args = parse_args(argv)
+    metrics = Metrics("fetch_data")
+    with profiling(args.profile, "fetch_data", metrics):
+        status = run(args)
+    metrics.print_report()
+    print(f"📊 계측 저장: {metrics.write(args.metrics)}")
+    return status
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
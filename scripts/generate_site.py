@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+여러 페이지 정적 사이트 생성
+
+데이터는 한 번만 읽고 시계열도 한 번만 계산한 뒤, 페이지 렌더링/쓰기를
+프로세스 풀로 나눠 돌린다. 워커는 시작할 때 dataset/시계열을 한 번 받아 두고
+페이지마다는 (경로, 제목, 심볼 목록)만 받는다.
+
+    site/index.html            전체
+    site/pair/eurusd.html      통화쌍별
+    site/region/asia.html      지역별 (G10 / 아시아 / 신흥국)
+    site/base/usd.html         기준 통화별
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from compress import minify_html
+from crosses import split_pair
+from generate_html import DATA_PATH, PAGE_TITLE, ROOT, fill_derived_blocks, render_page
+from series import rebased_series, subset_series
+from store import load_dataset
+
+SITE_DIR = ROOT / "site"
+
+REGIONS = {
+    "g10": ("G10 통화", {"EUR", "JPY", "GBP", "CHF", "AUD", "CAD", "NZD", "NOK", "SEK"}),
+    "asia": ("아시아 통화", {"JPY", "KRW", "CNY", "HKD", "SGD", "TWD", "INR", "THB", "IDR", "MYR", "PHP"}),
+    "em": ("신흥국 통화", {"KRW", "CNY", "MXN", "TRY", "BRL", "ZAR", "INR", "IDR", "PLN", "HUF", "CZK", "THB", "MYR", "PHP"}),
+}
+
+# 워커 프로세스마다 한 번 받아 두는 공유 데이터
+_data = None
+_series = None
+
+
+def plan_pages(data):
+    """[(상대 경로, 제목, 심볼 목록)] - 전체, 통화쌍별, 지역별, 기준 통화별"""
+    symbols = list(data["assets"])
+    pages = [("index.html", PAGE_TITLE, symbols)]
+
+    for symbol in symbols:
+        name = data["assets"][symbol]["name"]
+        pages.append((f"pair/{symbol.replace('=X', '').lower()}.html", f"{name} 환율", [symbol]))
+
+    pairs = {symbol: split_pair(symbol) for symbol in symbols if split_pair(symbol)}
+    for key, (title, currencies) in REGIONS.items():
+        members = [s for s, (base, quote) in pairs.items() if ({base, quote} - {"USD"}) & currencies]
+        if members:
+            pages.append((f"region/{key}.html", f"{title} 퍼포먼스 비교", members))
+
+    bases = {}
+    for symbol, (base, _) in pairs.items():
+        bases.setdefault(base, []).append(symbol)
+    for base, members in sorted(bases.items()):
+        pages.append((f"base/{base.lower()}.html", f"{base} 기준 환율 퍼포먼스 비교", members))
+    return pages
+
+
+def _init_worker(data, series):
+    global _data, _series
+    _data, _series = data, series
+
+
+def _render(out_dir, minify, page):
+    relative, title, symbols = page
+    data = dict(_data, assets={symbol: _data["assets"][symbol] for symbol in symbols})
+    html = render_page(data, subset_series(_series, symbols), title=title)
+    if minify:
+        html = minify_html(html)
+    path = Path(out_dir) / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(html, encoding="utf-8")
+    return relative, len(html.encode("utf-8"))
+
+
+def generate_site(data_path=DATA_PATH, out_dir=SITE_DIR, workers=None, minify=False):
+    data = fill_derived_blocks(load_dataset(data_path))
+    series = rebased_series(data)
+    pages = plan_pages(data)
+    workers = workers or os.cpu_count() or 1
+
+    start = time.perf_counter()
+    if workers == 1:
+        _init_worker(data, series)
+        results = [_render(out_dir, minify, page) for page in pages]
+    else:
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(data, series)) as pool:
+            chunksize = max(1, len(pages) // (workers * 4))
+            results = list(pool.map(_render, [out_dir] * len(pages), [minify] * len(pages), pages,
+                                    chunksize=chunksize))
+    elapsed = time.perf_counter() - start
+
+    total = sum(size for _, size in results)
+    print(f"✅ 사이트 생성 완료: {len(results)}페이지, {total / 1024 / 1024:.1f}MB, "
+          f"워커 {workers}개, {elapsed:.2f}s → {out_dir}")
+    return results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="통화쌍/지역/기준 통화별 정적 사이트 생성")
+    parser.add_argument("--data", type=Path, default=DATA_PATH, help="입력 performance.json 경로")
+    parser.add_argument("--out", type=Path, default=SITE_DIR, help="출력 디렉토리")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--minify", action="store_true", help="CSS/JS 들여쓰기와 주석 제거")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    generate_site(args.data, args.out, args.workers, args.minify)
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+추가 전용(append-only) 전체 이력 저장소
+
+performance.json은 보존 기간(400일) 창만 담는다. 전체 일봉 이력은 심볼마다
+고정폭 레코드 파일 하나에 쌓고, 매 실행은 새 봉만 파일 끝에 덧붙인다.
+
+    data/history/index.json     {"format": "history-v1", "record": [["day", "<i4"], ["price", "<f8"]],
+                                 "symbols": {"EURUSD=X": {"file": "EURUSD_X.bin", "name": ..., "color": ...}}}
+    data/history/EURUSD_X.bin   (epoch-day int32 LE, 가격 float64 LE) 12바이트 레코드, 날짜 오름차순
+
+레코드 수는 파일 크기에서 나오므로 덧붙이다 중간에 죽어도 index.json과 어긋나지 않는다.
+읽기는 np.memmap이라 창(window)을 자를 때 이진 탐색이 건드리는 페이지와 창 범위만 읽는다.
+겹쳐 다시 받은 날(마지막 저장일 이하)은 같은 날 레코드를 제자리에서 고쳐 쓴다.
+그중 저장소에 없던 날(늦게 올라온 봉)이 있으면 받은 첫 날부터 임시 파일에 다시 써서 교체한다.
+"""
+
+import bisect
+import json
+import os
+import re
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+from store import build_columnar, price_records
+
+HISTORY_DIR = Path(__file__).parent.parent / "data" / "history"
+FORMAT = "history-v1"
+RECORD = np.dtype([("day", "<i4"), ("price", "<f8")])
+EPOCH = date(1970, 1, 1)
+
+
+def to_day(value):
+    """'YYYY-MM-DD' / date -> epoch-day 정수"""
+    if isinstance(value, str):
+        value = date.fromisoformat(value)
+    if isinstance(value, datetime):
+        value = value.date()
+    return (value - EPOCH).days
+
+
+def from_day(day):
+    return (EPOCH + timedelta(days=int(day))).isoformat()
+
+
+class HistoryStore:
+    """심볼별 고정폭 레코드 파일 + index.json"""
+
+    def __init__(self, directory=HISTORY_DIR):
+        self.directory = Path(directory)
+        self.index = self._load_index()
+
+    def _load_index(self):
+        try:
+            with open(self.directory / "index.json", "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {"format": FORMAT, "record": RECORD.descr, "symbols": {}}
+        if index.get("format") != FORMAT:
+            raise ValueError(f"알 수 없는 이력 저장소 포맷: {index.get('format')}")
+        return index
+
+    def save_index(self):
+        """index.json 원자적 저장 (임시 파일에 쓰고 교체)"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = self.directory / f"index.json.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.index, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, self.directory / "index.json")
+
+    def symbols(self):
+        return list(self.index["symbols"])
+
+    def _path(self, symbol):
+        entry = self.index["symbols"].get(symbol)
+        if entry is None:
+            entry = self.index["symbols"][symbol] = {"file": re.sub(r"[^A-Za-z0-9]+", "_", symbol) + ".bin"}
+        return self.directory / entry["file"]
+
+    def records(self, symbol, writable=False):
+        """심볼 전체 레코드를 memmap으로 (없으면 빈 배열) - 실제로 읽히는 건 접근한 페이지뿐"""
+        if symbol not in self.index["symbols"]:
+            return np.zeros(0, dtype=RECORD)
+        path = self._path(symbol)
+        count = path.stat().st_size // RECORD.itemsize if path.exists() else 0
+        if count == 0:
+            return np.zeros(0, dtype=RECORD)
+        return np.memmap(path, dtype=RECORD, mode="r+" if writable else "r", shape=(count,))
+
+    def last_day(self, symbol):
+        """마지막 저장일 (date, 없으면 None)"""
+        records = self.records(symbol)
+        return date.fromisoformat(from_day(records[-1]["day"])) if len(records) else None
+
+    def read(self, symbol, start=None, end=None):
+        """[start, end] 창의 레코드 (memmap 슬라이스, 이진 탐색이라 전체를 읽지 않음)"""
+        records = self.records(symbol)
+        days = records["day"]
+        lo = bisect.bisect_left(days, to_day(start)) if start is not None else 0
+        hi = bisect.bisect_right(days, to_day(end)) if end is not None else len(records)
+        return records[lo:hi]
+
+    def append(self, symbol, prices, meta=None):
+        """[{date, price}] (날짜 오름차순)을 저장소에 반영 -> 새로 추가한 봉 수
+
+        마지막 저장일 이후 봉만 파일 끝에 붙이고, 이미 있는 날은 제자리에서 값만 고친다.
+        마지막 저장일 이전인데 없던 날이 섞여 있으면 _rewrite로 받은 첫 날부터 다시 쓴다.
+        """
+        path = self._path(symbol)
+        if meta:
+            self.index["symbols"][symbol].update(meta)
+        if not prices:
+            return 0
+        days = np.array([to_day(p["date"]) for p in prices], dtype=np.int64)
+        values = np.array([p["price"] for p in prices], dtype=np.float64)
+
+        existing = self.records(symbol, writable=True)
+        last = int(existing[-1]["day"]) if len(existing) else None
+        if last is not None:
+            old = days <= last
+            if old.any():
+                position = np.searchsorted(existing["day"], days[old])
+                position = np.minimum(position, len(existing) - 1)
+                same = existing["day"][position] == days[old]
+                if not same.all():
+                    del existing
+                    return self._rewrite(symbol, days, values)
+                existing["price"][position] = values[old]
+                existing.flush()
+            days, values = days[~old], values[~old]
+        del existing
+
+        new = np.zeros(len(days), dtype=RECORD)
+        new["day"], new["price"] = days, values
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "ab") as f:
+            f.write(new.tobytes())
+        return len(new)
+
+    def _rewrite(self, symbol, days, values):
+        """받은 첫 날부터 기존 레코드와 새 봉을 합쳐(같은 날은 새 값) 임시 파일에 쓰고 교체"""
+        path = self._path(symbol)
+        existing = self.records(symbol)
+        cut = int(np.searchsorted(existing["day"], days[0]))
+        tail = existing[cut:]
+        merged_days = np.concatenate([days, tail["day"]])
+        merged_values = np.concatenate([values, tail["price"]])
+        # np.unique는 정렬된 첫 등장 위치를 주므로 앞에 둔 새 봉 값이 이긴다
+        unique_days, first_seen = np.unique(merged_days, return_index=True)
+        merged = np.zeros(len(unique_days), dtype=RECORD)
+        merged["day"], merged["price"] = unique_days, merged_values[first_seen]
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(existing[:cut].tobytes())
+            f.write(merged.tobytes())
+        added = len(merged) - len(tail)
+        del existing, tail
+        os.replace(tmp, path)
+        return added
+
+    def resume_starts(self, symbols, overlap_days=5):
+        """심볼별 마지막 저장일 - overlap_days (저장된 심볼만) -> {심볼: datetime}"""
+        starts = {}
+        for symbol in symbols:
+            last = self.last_day(symbol)
+            if last is not None:
+                starts[symbol] = datetime(last.year, last.month, last.day) - timedelta(days=overlap_days)
+        return starts
+
+    def window(self, start=None, end=None, symbols=None):
+        """[start, end] 창만 {심볼: [{date, price}]}로 (빈 심볼은 제외)"""
+        result = {}
+        for symbol in symbols if symbols is not None else self.symbols():
+            records = self.read(symbol, start, end)
+            if len(records):
+                result[symbol] = [
+                    {"date": from_day(day), "price": float(price)}
+                    for day, price in zip(records["day"].tolist(), records["price"].tolist())
+                ]
+        return result
+
+
+def window_dataset(dataset, store, start, end=None):
+    """컬럼형 dataset의 날짜/가격을 저장소의 [start, end] 창으로 바꾼 새 dataset
+
+    성과/리스크 등 가격 외 필드는 그대로 두고, 저장소에 없는 심볼은 원래 가격을 쓴다.
+    """
+    window = store.window(start, end, symbols=list(dataset["assets"]))
+    assets = {}
+    for symbol, info in dataset["assets"].items():
+        # 저장소는 종가만 담으므로 bars는 원래 날짜 축과 함께 버리거나(저장소 심볼) 레코드로 되살린다
+        prices = window.get(symbol) or price_records(dataset, symbol)
+        assets[symbol] = {key: value for key, value in info.items() if key != "bars"}
+        assets[symbol]["prices"] = prices
+    extra = {key: value for key, value in dataset.items() if key not in ("format", "lastUpdated", "dates", "assets")}
+    return dict(build_columnar(dataset["lastUpdated"], assets), **extra)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+파이프라인 계측 (단계별/심볼별 벽시계·CPU 시간, 받은 바이트, 파싱한 행 수)
+
+    metrics = Metrics("fetch_data")
+    with metrics.stage("fetch"):
+        ...
+    metrics.record("EURUSD=X", wall=0.12, rows=400)   # 같은 키는 누적
+    metrics.write(path)                               # JSON Lines에 실행 한 줄 추가
+
+실행마다 한 줄씩 쌓이므로 밤마다 어느 단계가 느려졌는지 추세로 볼 수 있다.
+profiling(directory, name)은 cProfile 덤프(<name>.prof)와
+tracemalloc 상위 할당(<name>.tracemalloc.txt)을 남기고 최대 메모리를 기록한다.
+"""
+
+import cProfile
+import json
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+METRICS_DIR = Path(__file__).parent.parent / ".cache" / "metrics"
+
+
+class Metrics:
+    def __init__(self, name):
+        self.name = name
+        self.started = datetime.now()
+        self.stages = []
+        self.symbols = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name):
+        """with 블록의 벽시계/CPU(프로세스 전체) 시간을 단계로 기록"""
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            self.stages.append({
+                "name": name,
+                "wall": round(time.perf_counter() - wall, 4),
+                "cpu": round(time.process_time() - cpu, 4),
+            })
+
+    def record(self, key, **values):
+        """심볼(또는 청크)별 값 누적 - 스레드에서 불러도 된다"""
+        with self._lock:
+            entry = self.symbols.setdefault(key, {})
+            for name, value in values.items():
+                entry[name] = round(entry.get(name, 0) + value, 6)
+
+    def count(self, **values):
+        """실행 전체 카운터 누적 (출력 바이트 등)"""
+        with self._lock:
+            for name, value in values.items():
+                self.counters[name] = self.counters.get(name, 0) + value
+
+    def summary(self):
+        totals = {}
+        for entry in self.symbols.values():
+            for name, value in entry.items():
+                totals[name] = round(totals.get(name, 0) + value, 6)
+        return {
+            "name": self.name,
+            "started": self.started.isoformat(timespec="seconds"),
+            "stages": self.stages,
+            "counters": self.counters,
+            "totals": totals,
+            "symbols": self.symbols,
+        }
+
+    def write(self, path):
+        """JSON Lines 파일에 이번 실행 한 줄 추가"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(self.summary(), ensure_ascii=False, separators=(",", ":")) + "\n")
+        return path
+
+    def print_report(self):
+        print("\n⏱️ 단계별 시간 (벽시계 / CPU)")
+        for stage in self.stages:
+            print(f"  {stage['name']:24} {stage['wall']:8.3f}s / {stage['cpu']:8.3f}s")
+        timed = [(key, entry) for key, entry in self.symbols.items() if "wall" in entry]
+        slowest = sorted(timed, key=lambda item: item[1]["wall"], reverse=True)[:5]
+        if slowest:
+            print("  느린 심볼: " + ", ".join(f"{key} {entry['wall']:.2f}s" for key, entry in slowest))
+
+
+@contextmanager
+def profiling(directory, name, metrics=None):
+    """directory가 있으면 cProfile + tracemalloc으로 감싸고 결과를 파일로 남긴다"""
+    if directory is None:
+        yield
+        return
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    profiler = cProfile.Profile()
+    tracemalloc.start()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        profiler.dump_stats(directory / f"{name}.prof")
+        with open(directory / f"{name}.tracemalloc.txt", "w", encoding="utf-8") as f:
+            f.write(f"peak {peak / 1024 / 1024:.1f}MB\n")
+            for stat in snapshot.statistics("lineno")[:30]:
+                f.write(f"{stat}\n")
+        if metrics is not None:
+            metrics.count(peak_memory_bytes=peak)
+        print(f"🔬 프로파일 저장: {directory / (name + '.prof')}, 최대 메모리 {peak / 1024 / 1024:.1f}MB")
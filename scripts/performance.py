@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+벡터화 수익률 계산 엔진
+
+모든 심볼을 마스터 달력(alignment.py)에 맞춘 [심볼 x 날짜] 행렬로 놓고,
+기간마다 시작 인덱스를 달력 인덱스 표에서 바로 찾은 뒤
+모든 (심볼, 기간) 수익률을 한 번의 numpy 연산으로 구한다.
+
+결과는 fetch_data.calculate_performance와 같다: 시작가는 시작일 이후
+첫 가격, 종가는 심볼의 마지막 가격, 소수 둘째 자리 반올림.
+"""
+
+import re
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+from alignment import price_matrix, start_indices
+
+DEFAULT_PERIODS = ["1W", "1M", "3M", "12M", "YTD"]
+
+# 기존 화면 기간 (get_date_ranges와 같은 일수)
+FIXED_DAYS = {"1W": 7, "1M": 30, "3M": 90, "12M": 365}
+UNIT_DAYS = {"D": 1, "W": 7, "M": 30, "Y": 365}
+
+
+def resolve_period(period, today=None):
+    """기간 정의 -> 시작일(date)
+
+    1W/1M/3M/12M, YTD/MTD/QTD, nD/nW/nM/nY (예: 5Y), YYYY-MM-DD, date/datetime.
+    """
+    today = today or date.today()
+    if isinstance(period, datetime):
+        return period.date()
+    if isinstance(period, date):
+        return period
+    if period in FIXED_DAYS:
+        return today - timedelta(days=FIXED_DAYS[period])
+    if period == "YTD":
+        return date(today.year, 1, 1)
+    if period == "MTD":
+        return date(today.year, today.month, 1)
+    if period == "QTD":
+        return date(today.year, (today.month - 1) // 3 * 3 + 1, 1)
+    match = re.fullmatch(r"(\d+)([DWMY])", period)
+    if match:
+        return today - timedelta(days=int(match.group(1)) * UNIT_DAYS[match.group(2)])
+    try:
+        return date.fromisoformat(period)
+    except ValueError:
+        raise ValueError(f"알 수 없는 기간: {period}") from None
+
+
+def next_valid_index(matrix):
+    """각 칸에서 그 칸 이후(포함) 첫 유효 가격의 인덱스 (없으면 날짜 수)"""
+    n = matrix.shape[1]
+    index = np.where(np.isnan(matrix), n, np.arange(n))
+    return np.minimum.accumulate(index[:, ::-1], axis=1)[:, ::-1]
+
+
+def last_valid_index(matrix):
+    """심볼별 마지막 유효 가격의 인덱스 (없으면 -1)"""
+    valid = ~np.isnan(matrix)
+    last = matrix.shape[1] - 1 - np.argmax(valid[:, ::-1], axis=1)
+    return np.where(valid.any(axis=1), last, -1)
+
+
+def anchor_indices(matrix, start_idx):
+    """시작 인덱스마다 심볼별 그 이후(포함) 첫 유효 가격의 인덱스 [심볼 x 시작 인덱스] (없으면 날짜 수)"""
+    n_symbols, n_dates = matrix.shape
+    first = np.hstack([next_valid_index(matrix), np.full((n_symbols, 1), n_dates)])
+    return first[:, start_idx]
+
+
+def start_prices(matrix, start_idx):
+    """시작 인덱스마다 그 이후(포함) 첫 유효 가격 [심볼 x 시작 인덱스] (없으면 NaN)"""
+    padded = np.hstack([matrix, np.full((matrix.shape[0], 1), np.nan)])
+    return np.take_along_axis(padded, anchor_indices(matrix, start_idx), axis=1)
+
+
+def period_returns(dates, matrix, starts):
+    """시작일 배열에 대한 수익률 행렬 [심볼 x 기간] (%, 계산 불가는 NaN)"""
+    n_symbols, n_dates = matrix.shape
+    if n_dates == 0:
+        return np.full((n_symbols, len(starts)), np.nan)
+    start_idx = start_indices(dates, starts)
+    start_price = start_prices(matrix, start_idx)
+    end_price = matrix[np.arange(n_symbols), last_valid_index(matrix)][:, None]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = (end_price - start_price) / start_price * 100
+    returns[(start_price == 0) | ~np.isfinite(returns)] = np.nan
+    return np.round(returns, 2)
+
+
+def compute_performance(dataset, periods=DEFAULT_PERIODS, today=None):
+    """컬럼형 dataset의 모든 심볼 x 기간 수익률 -> {심볼: {기간: 수익률 또는 None}}"""
+    dates, symbols, matrix = price_matrix(dataset)
+    starts = [resolve_period(period, today) for period in periods]
+    returns = period_returns(dates, matrix, starts)
+    return {
+        symbol: {
+            str(period): None if np.isnan(value) else float(value)
+            for period, value in zip(periods, row)
+        }
+        for symbol, row in zip(symbols, returns)
+    }
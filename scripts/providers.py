@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+가격 데이터 provider
+
+모든 provider는 같은 두 메서드를 제공한다.
+  - history(symbol, start, end, timeout): 한 심볼의 OHLC DataFrame
+  - download(symbols, start, end): 여러 심볼을 (symbol, field) MultiIndex 컬럼으로 묶은 DataFrame
+
+사용할 provider는 --provider 옵션 또는 FX_PROVIDER 환경변수로 고른다.
+"""
+
+import json
+import os
+from pathlib import Path
+
+
+class YFinanceProvider:
+    """Yahoo Finance (yfinance) 백엔드"""
+
+    name = "yfinance"
+    cacheable = True
+
+    def __init__(self):
+        # yfinance(+pandas) import가 느리므로 실제로 쓸 때만 불러온다
+        import yfinance
+        self._yf = yfinance
+
+    def assets(self):
+        return None
+
+    def history(self, symbol, start, end, timeout=10):
+        return self._yf.Ticker(symbol).history(start=start, end=end, timeout=timeout)
+
+    def download(self, symbols, start, end):
+        return self._yf.download(
+            list(symbols),
+            start=start,
+            end=end,
+            group_by="ticker",
+            auto_adjust=False,
+            threads=True,
+            progress=False,
+        )
+
+
+class FileProvider:
+    """로컬 CSV/Parquet 픽스처 백엔드 (네트워크 없음)
+
+    directory/<심볼>.csv 또는 directory/<심볼>.parquet 파일을 읽는다.
+    파일에는 Date 컬럼(또는 인덱스)과 Close 컬럼이 있어야 하며 OHLC/Volume은 선택.
+    directory/assets.json 이 있으면 그 안의 {심볼: {name, color}}를 자산 목록으로 쓴다.
+    """
+
+    name = "file"
+    cacheable = False
+
+    def __init__(self, directory):
+        import pandas
+        self._pd = pandas
+        self.directory = Path(directory)
+        if not self.directory.is_dir():
+            raise FileNotFoundError(f"픽스처 디렉토리가 없습니다: {self.directory}")
+        self._frames = {}
+
+    def assets(self):
+        path = self.directory / "assets.json"
+        if not path.exists():
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _load(self, symbol):
+        if symbol not in self._frames:
+            parquet = self.directory / f"{symbol}.parquet"
+            csv = self.directory / f"{symbol}.csv"
+            if parquet.exists():
+                frame = self._pd.read_parquet(parquet)
+            elif csv.exists():
+                frame = self._pd.read_csv(csv)
+            else:
+                frame = self._pd.DataFrame()
+            if "Date" in frame.columns:
+                frame = frame.set_index(self._pd.to_datetime(frame.pop("Date")))
+            self._frames[symbol] = frame.sort_index()
+        return self._frames[symbol]
+
+    def history(self, symbol, start, end, timeout=None):
+        frame = self._load(symbol)
+        if frame.empty:
+            return frame
+        return frame.loc[self._pd.Timestamp(start).normalize():self._pd.Timestamp(end)]
+
+    def download(self, symbols, start, end):
+        frames = {symbol: self.history(symbol, start, end) for symbol in symbols}
+        frames = {symbol: frame for symbol, frame in frames.items() if not frame.empty}
+        if not frames:
+            return self._pd.DataFrame()
+        return self._pd.concat(frames, axis=1)
+
+
+def get_provider(name=None, fixtures=None):
+    """이름(없으면 FX_PROVIDER, 기본 yfinance)으로 provider 생성"""
+    name = name or os.environ.get("FX_PROVIDER", "yfinance")
+    if name == "yfinance":
+        return YFinanceProvider()
+    if name == "file":
+        fixtures = fixtures or os.environ.get("FX_FIXTURES_DIR")
+        if not fixtures:
+            raise ValueError("file provider는 --fixtures 또는 FX_FIXTURES_DIR이 필요합니다")
+        return FileProvider(fixtures)
+    raise ValueError(f"알 수 없는 provider: {name}")
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+HTML 증분 재생성
+
+- 입력 해시 manifest: 데이터(lastUpdated 제외) + 생성 코드 + 옵션 + 기간 시작 위치의
+  해시가 지난번과 같으면 렌더링/쓰기를 통째로 건너뛴다.
+  스트리밍 레이아웃 파일은 다시 인코딩하지 않고 줄(심볼) 단위 바이트를 해시한다.
+- 심볼별 조각 캐시: 일부 심볼만 바뀌었으면 그 심볼의 기간별 시계열만 다시 계산하고
+  나머지는 .cache/render/ 의 조각을 재사용한다. 조각은 max_bytes를 넘을 때만
+  가장 오래 안 쓴 것부터 지우므로 출력/이력 창을 번갈아 만들어도 서로의 조각을 지우지 않는다.
+"""
+
+import hashlib
+import json
+import os
+import re
+from bisect import bisect_left
+from pathlib import Path
+
+from performance import DEFAULT_PERIODS, resolve_period
+from series import rebased_series
+from store import ASSETS_OPEN
+
+SCRIPTS_DIR = Path(__file__).parent
+RENDER_CACHE_DIR = SCRIPTS_DIR.parent / ".cache" / "render"
+RENDER_CACHE_BYTES = 64 * 1024 * 1024
+
+# 이 파일들이 바뀌면 같은 데이터라도 결과가 달라진다
+CODE_FILES = [
+    "generate_html.py", "template.py", "templates/index.html",
+    "series.py", "downsample.py", "performance.py", "compress.py", "store.py", "crosses.py",
+    "correlation.py", "risk.py", "alignment.py", "history_store.py", "schema.py",
+]
+
+
+def _digest(value):
+    body = json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+
+def code_hash():
+    digest = hashlib.sha256()
+    for name in CODE_FILES:
+        digest.update((SCRIPTS_DIR / name).read_bytes())
+    return digest.hexdigest()
+
+
+def period_starts(dates, periods=DEFAULT_PERIODS, today=None):
+    """기간별 시작 위치 (날짜 축 인덱스) - 날짜가 바뀌어도 이게 같으면 결과도 같다"""
+    return [bisect_left(dates, resolve_period(period, today).isoformat()) for period in periods]
+
+
+def file_digests(path, data):
+    """스트리밍 레이아웃 performance.json의 바이트 해시 {"header", "assets": {심볼: 해시}, "blocks"}
+
+    헤더 줄은 lastUpdated만 빼고, 심볼 줄은 그대로(사이드카면 그 심볼의 가격 행까지) 해시한다.
+    심볼 순서는 같은 파일에서 읽은 data["assets"] 순서. 스트리밍 레이아웃이 아니면 None.
+    """
+    path = Path(path)
+    with open(path, "rb") as f:
+        header = f.readline()
+        if not header.rstrip(b"\n").endswith(ASSETS_OPEN.encode()):
+            return None
+        header = re.sub(rb'"lastUpdated":"[^"]*",?', b"", header)
+        binary = json.loads(header[:header.rindex(b',"assets"')] + b"}").get("binary")
+        sidecar = open(path.parent / binary["file"], "rb") if binary else None
+        assets = {}
+        try:
+            for symbol, line in zip(data["assets"], f):
+                digest = hashlib.sha256(line)
+                if sidecar is not None:
+                    digest.update(sidecar.read(binary["shape"][1] * 4))
+                assets[symbol] = digest.hexdigest()
+        finally:
+            if sidecar is not None:
+                sidecar.close()
+        blocks = hashlib.sha256(f.read()).hexdigest()
+    return {"header": hashlib.sha256(header).hexdigest(), "assets": assets, "blocks": blocks}
+
+
+def data_digests(data):
+    """file_digests와 같은 모양을 디코드된 dataset에서 (예전 포맷, 이력 저장소 창 등)"""
+    rest = {key: value for key, value in data.items() if key not in ("lastUpdated", "assets")}
+    return {
+        "header": _digest(rest),
+        "assets": {symbol: _digest(info) for symbol, info in data["assets"].items()},
+        "blocks": "",
+    }
+
+
+def input_hash(data, options, digests):
+    """digests(file_digests/data_digests 결과) + 코드 + 옵션 + 기간 시작 위치 해시"""
+    return _digest([code_hash(), options, period_starts(data["dates"]), digests["header"],
+                    list(digests["assets"].items()), digests["blocks"]])
+
+
+def manifest_path(output_path):
+    return Path(output_path).with_suffix(".manifest.json")
+
+
+def is_up_to_date(output_path, digest, suffixes=()):
+    """manifest의 입력 해시가 digest와 같고 출력(+ suffixes 압축본)이 다 있으면 True"""
+    path = manifest_path(output_path)
+    outputs = [Path(output_path)] + [Path(f"{output_path}{suffix}") for suffix in suffixes]
+    if not all(output.exists() for output in outputs) or not path.exists():
+        return False
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f).get("inputHash") == digest
+
+
+def save_manifest(output_path, digest):
+    with open(manifest_path(output_path), "w", encoding="utf-8") as f:
+        json.dump({"inputHash": digest, "output": Path(output_path).name}, f, indent=1)
+
+
+def _fragment(entry, symbol):
+    fragment = {}
+    if "values" in entry:
+        fragment["values"] = entry["values"].get(symbol)
+    if "sampled" in entry:
+        fragment["sampled"] = {screen: points.get(symbol) for screen, points in entry["sampled"].items()}
+    return fragment
+
+
+def _place(entry, symbol, fragment):
+    if fragment.get("values") is not None:
+        entry["values"][symbol] = fragment["values"]
+    for screen, points in fragment.get("sampled", {}).items():
+        if points is not None:
+            entry["sampled"][screen][symbol] = points
+
+
+def _prune(cache_dir, max_bytes):
+    """조각 전체가 max_bytes를 넘는 만큼 가장 오래 안 쓴 것부터 삭제 (LRU)"""
+    files = []
+    for path in cache_dir.glob("*.json"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        files.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in files)
+    for _, size, path in sorted(files):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+def cached_rebased_series(data, cache_dir=None, digests=None, max_bytes=RENDER_CACHE_BYTES):
+    """rebased_series(data)와 같은 결과, 바뀐 심볼만 다시 계산
+
+    (조각 캐시 적중 수, 다시 계산한 수)도 함께 반환. cache_dir 기본값은 RENDER_CACHE_DIR.
+    digests(input_hash에 쓴 것)를 주면 심볼별 해시를 조각 키로 재사용한다.
+    """
+    cache_dir = Path(cache_dir or RENDER_CACHE_DIR)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # 심볼 없이 돌리면 날짜 축, 기간 시작 위치, 기간별 values/sampled 여부만 나온다
+    result = rebased_series({"dates": data["dates"], "assets": {}})
+    axis_key = _digest([code_hash(), data["dates"], period_starts(data["dates"])])
+
+    if digests is None:
+        keys = {symbol: _digest([axis_key, info["prices"]]) for symbol, info in data["assets"].items()}
+    else:
+        keys = {symbol: _digest([axis_key, digests["assets"][symbol]]) for symbol in data["assets"]}
+    fragments = {}
+    for symbol, key in keys.items():
+        path = cache_dir / f"{key}.json"
+        if path.exists():
+            with open(path, "r", encoding="utf-8") as f:
+                fragments[symbol] = json.load(f)
+            os.utime(path)  # LRU 순서 갱신
+
+    missing = [symbol for symbol in keys if symbol not in fragments]
+    if missing:
+        fresh = rebased_series({"dates": data["dates"], "assets": {s: data["assets"][s] for s in missing}})
+        for symbol in missing:
+            fragments[symbol] = {
+                period: _fragment(entry, symbol) for period, entry in fresh["periods"].items()
+            }
+            with open(cache_dir / f"{keys[symbol]}.json", "w", encoding="utf-8") as f:
+                json.dump(fragments[symbol], f, separators=(",", ":"))
+
+    for symbol in keys:
+        for period, entry in result["periods"].items():
+            _place(entry, symbol, fragments[symbol][period])
+
+    _prune(cache_dir, max_bytes)
+
+    return result, len(keys) - len(missing), len(missing)
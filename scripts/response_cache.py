@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+데이터 provider 응답 디스크 캐시
+
+(namespace, 심볼)마다 JSON 파일 하나에 봉을 모아 둔다.
+마감돼 더 이상 고쳐지지 않는 봉(오늘 - 1 - overlap_days일 이전)은 만료 없이
+[from, through] 구간으로 쌓이고, 그 뒤 최근 봉(tail: 겹침 구간 + 오늘)만
+today_ttl초 뒤에 만료된다. 읽을 때 둘을 합치며, 만료되면 through 다음 날부터만
+다시 받는다. 겹침 구간을 tail에 두는 건 증분 수집(--overlap)이 나중에 수정된
+종가를 다시 받을 수 있게 하기 위해서다.
+전체 크기가 max_bytes를 넘으면 가장 오래 안 쓴 파일부터 지운다 (LRU).
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / ".cache" / "responses"
+
+
+def _day(value):
+    return value.strftime("%Y-%m-%d")
+
+
+class ResponseCache:
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=64 * 1024 * 1024,
+                 today_ttl=15 * 60, refresh=False, namespace="yfinance", overlap_days=5):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.today_ttl = today_ttl
+        self.refresh = refresh
+        self.namespace = namespace
+        self.overlap_days = overlap_days
+        self.hits = 0
+        self.partial = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _path(self, symbol):
+        raw = f"{self.namespace}|{symbol}"
+        return self.directory / f"{hashlib.sha1(raw.encode()).hexdigest()}.json"
+
+    def _load(self, path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _settled(self, now):
+        """이 날(포함)까지의 봉은 마감돼 만료 없이 둔다"""
+        return _day(now - timedelta(days=1 + self.overlap_days))
+
+    def _count(self, name):
+        # concurrent 모드에서는 워커 스레드들이 get을 동시에 부른다
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def _touch(self, path):
+        """LRU 순서 갱신 (evict와 같은 락 안에서, 그사이 지워졌으면 그냥 둔다)"""
+        with self._lock:
+            try:
+                os.utime(path)
+            except FileNotFoundError:
+                pass
+
+    def get(self, symbol, start, end):
+        """(캐시된 봉 리스트, 더 받아야 할 시작일)
+
+        시작일이 None이면 [start, end]가 캐시로 다 채워진 것이고,
+        아니면 리스트는 그 시작일 전날까지의 마감 봉이다 (전부 미스면 빈 리스트와 start).
+        """
+        path = self._path(symbol)
+        entry = None if self.refresh else self._load(path)
+        start_day, end_day = _day(start), _day(end)
+        if entry is None or entry["from"] > start_day:
+            self._count("misses")
+            return [], start
+        self._touch(path)
+        closed = [p for p in entry["closed"] if start_day <= p["date"] <= end_day]
+        if entry["through"] >= end_day:
+            self._count("hits")
+            return closed, None
+        now = datetime.now()
+        if (entry["through"] >= self._settled(now) and entry["tailDay"] == _day(now)
+                and time.time() - entry["storedAt"] <= self.today_ttl):
+            self._count("hits")
+            return closed + [p for p in entry["tail"] if p["date"] <= end_day], None
+        self._count("partial")
+        return closed, datetime.strptime(entry["through"], "%Y-%m-%d") + timedelta(days=1)
+
+    def put(self, symbol, start, end, prices):
+        """[start, end]를 받은 결과 저장 (이어지는 기존 마감 구간이 있으면 뒤에 덧붙임)"""
+        now = datetime.now()
+        today = _day(now)
+        start_day, end_day = _day(start), _day(end)
+        through = min(end_day, self._settled(now))
+        path = self._path(symbol)
+        with self._lock:
+            entry = self._load(path)
+            contiguous = (entry is not None and entry["from"] <= start_day
+                          and entry["through"] >= _day(start - timedelta(days=1)))
+            if not contiguous:
+                if not prices:
+                    return
+                entry = {"symbol": symbol, "from": start_day, "through": through,
+                         "closed": [], "tail": [], "tailDay": None, "storedAt": 0}
+            old = entry["closed"]
+            entry["closed"] = ([p for p in old if p["date"] < start_day]
+                               + [p for p in prices if p["date"] <= through]
+                               + [p for p in old if p["date"] > through])
+            entry["through"] = max(entry["through"], through)
+            if end_day > through:
+                entry["tail"] = [p for p in prices if through < p["date"] <= end_day]
+                entry["tailDay"] = today
+                entry["storedAt"] = time.time()
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(entry, f, separators=(",", ":"))
+            os.replace(tmp, path)
+        self.evict()
+
+    def evict(self):
+        """max_bytes를 넘는 만큼 가장 오래 안 쓴 파일부터 삭제"""
+        with self._lock:
+            files = []
+            for path in self.directory.glob("*.json"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+            total = sum(size for _, size, _ in files)
+            for _, size, path in sorted(files):
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+리스크 지표 계산 (변동성, 최대 낙폭, 수익/변동성 비율)
+
+performance.py처럼 모든 심볼을 [심볼 x 날짜] 행렬 하나로 놓고 계산한다.
+일간 로그수익률의 누적합/제곱누적합/개수 누적을 한 번 만들어 두면
+어떤 구간의 평균/표준편차든 뺄셈 두 번이라 윈도우마다 다시 더하지 않는다.
+낙폭은 누적 최댓값(np.fmax.accumulate) 한 번으로 구한다.
+기간은 심볼마다 시작일 이후 첫 가격이 있는 날(기준일)부터라 수익률 계산과 같은 기준이다.
+
+    "risk": {"vol20": 8.12, "vol60": 7.95,
+             "periods": {"YTD": {"vol": 7.5, "maxDrawdown": -3.21,
+                                 "peak": "2026-02-02", "trough": "2026-03-10",
+                                 "ratio": 1.12}}}
+
+변동성은 연율화(%), ratio는 무위험 수익률 0의 샤프 비율 형태
+(일간 평균 / 일간 표준편차 * sqrt(252)).
+"""
+
+import numpy as np
+
+from alignment import forward_fill, price_matrix, start_indices
+from performance import DEFAULT_PERIODS, anchor_indices, resolve_period
+
+TRADING_DAYS = 252
+ROLLING_WINDOWS = (20, 60)
+
+
+def log_returns(matrix):
+    """직전 유효 가격 대비 일간 로그수익률 [심볼 x 날짜] (그날 가격이 없으면 NaN, 첫 칸은 NaN)"""
+    filled = forward_fill(matrix)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.diff(np.log(filled), axis=1, prepend=np.nan)
+    returns[np.isnan(matrix) | ~np.isfinite(returns)] = np.nan
+    return returns
+
+
+def _cumulative(returns):
+    """(개수, 합, 제곱합) 누적 - 앞에 0 한 칸을 붙여 구간 [a, b)는 c[b] - c[a]"""
+    valid = ~np.isnan(returns)
+    values = np.where(valid, returns, 0.0)
+    pad = np.zeros((returns.shape[0], 1))
+    return tuple(
+        np.hstack([pad, np.cumsum(x, axis=1)])
+        for x in (valid.astype(np.float64), values, values * values)
+    )
+
+
+def _window_stats(cumulative, start, end):
+    """구간 [start, end)의 (개수, 평균, 표본 표준편차) - start/end는 심볼별 인덱스 배열"""
+    count, total, squares = (np.take_along_axis(c, end[:, None], 1)[:, 0]
+                             - np.take_along_axis(c, start[:, None], 1)[:, 0] for c in cumulative)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = total / count
+        var = (squares - total * mean) / (count - 1)
+    std = np.sqrt(np.clip(var, 0, None))
+    std[count < 2] = np.nan
+    return count, mean, std
+
+
+def rolling_volatility(returns, window):
+    """마지막 날 기준 window일 연율화 변동성 (%) - 윈도우에 수익률이 절반도 없으면 NaN"""
+    n_symbols, n_dates = returns.shape
+    cumulative = _cumulative(returns)
+    end = np.full(n_symbols, n_dates)
+    start = np.maximum(end - window, 0)
+    count, _, std = _window_stats(cumulative, start, end)
+    vol = std * np.sqrt(TRADING_DAYS) * 100
+    vol[count < window / 2] = np.nan
+    return vol
+
+
+def max_drawdown(matrix, start):
+    """심볼별 start 인덱스 이후 최대 낙폭 -> (낙폭 %, 고점 인덱스, 저점 인덱스), 계산 불가는 (NaN, -1, -1)
+
+    start는 심볼별 첫 가격이 있는 날(기준일). 그 이전 칸은 가리고 빈 날은 직전 가격으로 채우되,
+    고점/저점은 실제 가격이 있는 날만 가리킨다.
+    """
+    n_symbols = matrix.shape[0]
+    start = np.broadcast_to(start, (n_symbols,))
+    offset = int(start.min()) if n_symbols else 0
+    window = matrix[:, offset:]
+    n = window.shape[1]
+    if n == 0:
+        return np.full(n_symbols, np.nan), np.full(n_symbols, -1), np.full(n_symbols, -1)
+    positions = np.arange(n)
+    window = np.where(positions >= (start - offset)[:, None], window, np.nan)
+    observed = ~np.isnan(window)
+    window = forward_fill(window)
+    running_max = np.fmax.accumulate(window, axis=1)
+    with np.errstate(invalid="ignore"):
+        drawdown = window / running_max - 1
+    # 고점 인덱스도 누적으로: 실제 가격이 누적 최댓값과 같았던 마지막 칸
+    peak_at = np.maximum.accumulate(np.where(observed & (window == running_max), positions, 0), axis=1)
+    has_value = ~np.isnan(drawdown).all(axis=1)
+    trough = np.argmin(np.where(np.isnan(drawdown), np.inf, drawdown), axis=1)
+    rows = np.arange(n_symbols)
+    depth = np.where(has_value, drawdown[rows, trough] * 100, np.nan)
+    peak = np.where(has_value, peak_at[rows, trough] + offset, -1)
+    trough = np.where(has_value, trough + offset, -1)
+    return depth, peak, trough
+
+
+def _number(value):
+    return None if not np.isfinite(value) else round(float(value), 2)
+
+
+def compute_risk(dataset, periods=DEFAULT_PERIODS, today=None):
+    """컬럼형 dataset의 심볼별 리스크 지표 -> {심볼: risk 블록}"""
+    dates, symbols, matrix = price_matrix(dataset)
+    n_symbols, n_dates = matrix.shape
+    returns = log_returns(matrix)
+    cumulative = _cumulative(returns)
+    date_strings = [str(d) for d in dates]
+
+    rolling = {window: rolling_volatility(returns, window) for window in ROLLING_WINDOWS}
+    starts = start_indices(dates, [resolve_period(period, today) for period in periods])
+
+    # 심볼별 기준일: 시작일 이후(포함) 첫 가격이 있는 날 (start_prices와 같은 기준)
+    anchors = anchor_indices(matrix, starts)
+    end = np.full(n_symbols, n_dates)
+
+    per_period = {}
+    for period, anchor in zip(periods, anchors.T):
+        # 기준일 수익률(그 전 가격 대비)은 기간 밖, 기준일 다음 수익률부터 기간 안
+        _, mean, std = _window_stats(cumulative, np.minimum(anchor + 1, n_dates), end)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = mean / std * np.sqrt(TRADING_DAYS)
+        depth, peak, trough = max_drawdown(matrix, anchor)
+        per_period[str(period)] = (std * np.sqrt(TRADING_DAYS) * 100, ratio, depth, peak, trough)
+
+    result = {}
+    for row, symbol in enumerate(symbols):
+        block = {f"vol{window}": _number(vol[row]) for window, vol in rolling.items()}
+        block["periods"] = {}
+        for period, (vol, ratio, depth, peak, trough) in per_period.items():
+            block["periods"][period] = {
+                "vol": _number(vol[row]),
+                "maxDrawdown": _number(depth[row]),
+                "peak": date_strings[peak[row]] if peak[row] >= 0 else None,
+                "trough": date_strings[trough[row]] if trough[row] >= 0 else None,
+                "ratio": _number(ratio[row]),
+            }
+        result[symbol] = block
+    return result
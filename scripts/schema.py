@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+performance.json 타입 스키마와 JSON 코덱
+
+파일의 모양을 TypedDict로 적어 두고, 읽을 때(디코드 시점) 한 번에 검증한다.
+결과는 지금처럼 평범한 dict/list라 나머지 코드는 그대로 쓴다.
+
+코덱은 설치된 것 중 빠른 것을 고른다 (FX_JSON_BACKEND 환경변수로 강제 가능):
+
+    msgspec   타입을 주고 디코드 - 파싱과 검증이 C에서 한 번에
+    orjson    빠른 파싱/직렬화 + 이 모듈의 검증기
+    json      표준 라이브러리 + 이 모듈의 검증기
+
+스키마에 맞지 않으면 SchemaError(ValueError)에 위치($.assets.EURUSD=X.prices[3])를 담아 던진다.
+어느 코덱이든 같은 파일을 같은 값으로 읽는다: NaN/Infinity는 null로 쓰고,
+스키마에 없는 필드는 버리지 않고 그대로 둔다.
+"""
+
+import json
+import math
+import os
+import types
+from typing import (Any, Literal, NotRequired, TypedDict, Union, get_args, get_origin,
+                    get_type_hints, is_typeddict)
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+Number = float | None
+
+
+class Binary(TypedDict):
+    file: str
+    dtype: str
+    shape: list[int]
+    symbols: list[str]
+
+
+class Asset(TypedDict):
+    # 심볼에 새 필드를 실으면 여기에도 추가 (스키마에 없는 필드는 검증 없이 그대로 통과)
+    name: str
+    color: str
+    performance: dict[str, Number]
+    prices: NotRequired[list[Number]]           # 바이너리 사이드카면 JSON에는 없음
+    bars: NotRequired[dict[str, list[Number]]]
+    risk: NotRequired[dict[str, Any]]
+
+
+class Header(TypedDict):
+    format: Literal["columnar-v1"]
+    lastUpdated: str
+    dates: list[str]
+    binary: NotRequired[Binary]
+
+
+class Dataset(Header):
+    assets: dict[str, Asset]
+
+
+class PriceRecord(TypedDict):
+    date: str
+    price: float
+
+
+class LegacyAsset(TypedDict):
+    name: str
+    color: str
+    performance: dict[str, Number]
+    prices: list[PriceRecord]
+
+
+class LegacyDataset(TypedDict):
+    lastUpdated: str
+    assets: dict[str, LegacyAsset]
+
+
+class SchemaError(ValueError):
+    pass
+
+
+BACKENDS = [name for name, module in (("msgspec", msgspec), ("orjson", orjson)) if module] + ["json"]
+backend = None
+
+
+def use_backend(name=None):
+    """코덱 선택 (None이면 FX_JSON_BACKEND, 없으면 설치된 것 중 가장 빠른 것) -> 이전 코덱 이름"""
+    global backend
+    name = name or os.environ.get("FX_JSON_BACKEND") or BACKENDS[0]
+    if name not in BACKENDS:
+        raise ValueError(f"사용할 수 없는 JSON 코덱: {name} (가능: {', '.join(BACKENDS)})")
+    previous, backend = backend, name
+    return previous
+
+
+# ---- 검증기 (orjson/json용) ----
+
+_SCALARS = {float: (float, int), int: (int,), str: (str,), bool: (bool,), type(None): (type(None),)}
+
+
+def _scalar_types(tp):
+    """스칼라(또는 스칼라 Union)면 허용하는 type() 집합, 아니면 None"""
+    options = get_args(tp) if get_origin(tp) in (Union, types.UnionType) else (tp,)
+    if not all(option in _SCALARS for option in options):
+        return None
+    return frozenset(t for option in options for t in _SCALARS[option])
+
+
+def _name(tp):
+    return getattr(tp, "__name__", None) or str(tp)
+
+
+def _compile(tp):
+    """타입 -> check(value, path) 함수 (틀리면 SchemaError)"""
+    if tp is Any:
+        return lambda value, path: None
+
+    allowed = _scalar_types(tp)
+    if allowed is not None:
+        def check_scalar(value, path):
+            if type(value) not in allowed:
+                raise SchemaError(f"{_name(tp)} 필요, {type(value).__name__} - {path}")
+        return check_scalar
+
+    origin, args = get_origin(tp), get_args(tp)
+    if origin is Literal:
+        def check_literal(value, path):
+            if value not in args:
+                raise SchemaError(f"{' | '.join(map(repr, args))} 중 하나 필요, {value!r} - {path}")
+        return check_literal
+
+    if origin in (Union, types.UnionType):
+        checks = [_compile(option) for option in args]
+
+        def check_union(value, path):
+            for check in checks:
+                try:
+                    return check(value, path)
+                except SchemaError:
+                    pass
+            raise SchemaError(f"{_name(tp)} 필요, {type(value).__name__} - {path}")
+        return check_union
+
+    if origin is list:
+        item_types = _scalar_types(args[0])
+        check_item = _compile(args[0])
+
+        def check_list(value, path):
+            if type(value) is not list:
+                raise SchemaError(f"array 필요, {type(value).__name__} - {path}")
+            # 숫자 배열은 원소마다 함수를 부르지 않고 type 집합으로 한 번에
+            if item_types is not None and set(map(type, value)) <= item_types:
+                return
+            for i, item in enumerate(value):
+                check_item(item, f"{path}[{i}]")
+        return check_list
+
+    if origin is dict:
+        check_value = _compile(args[1])
+
+        def check_dict(value, path):
+            if type(value) is not dict:
+                raise SchemaError(f"object 필요, {type(value).__name__} - {path}")
+            for key, item in value.items():
+                check_value(item, f"{path}.{key}")
+        return check_dict
+
+    if is_typeddict(tp):
+        fields = {key: _compile(hint) for key, hint in get_type_hints(tp).items()}
+        required = tp.__required_keys__
+
+        def check_typeddict(value, path):
+            if type(value) is not dict:
+                raise SchemaError(f"object 필요, {type(value).__name__} - {path}")
+            missing = required - value.keys()
+            if missing:
+                raise SchemaError(f"필수 필드 없음 {sorted(missing)} - {path}")
+            # 모르는 필드는 그대로 둔다 (새 블록이 생겨도 예전 코드가 읽을 수 있게)
+            for key, check in fields.items():
+                if key in value:
+                    check(value[key], f"{path}.{key}")
+        return check_typeddict
+
+    raise TypeError(f"지원하지 않는 스키마 타입: {tp}")
+
+
+_validators = {}
+
+
+def validate(value, schema):
+    """이미 디코드된 값을 스키마로 검증 -> 같은 값 (스키마에 없는 필드도 그대로)"""
+    if schema is Any:
+        return value
+    if backend == "msgspec":
+        try:
+            msgspec.convert(value, schema)
+            return value
+        except msgspec.ValidationError as e:
+            raise SchemaError(str(e)) from None
+    if schema not in _validators:
+        _validators[schema] = _compile(schema)
+    _validators[schema](value, "$")
+    return value
+
+
+def decode(text, schema=Any):
+    """JSON 문자열 -> 스키마로 검증된 값 (틀린 JSON도, 틀린 모양도 ValueError 계열)"""
+    if backend == "msgspec":
+        # 스키마를 Decoder에 주면 모르는 필드를 버리므로 Any로 디코드하고 convert로 검증만 한다
+        try:
+            value = msgspec.json.decode(text)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from None
+    else:
+        value = orjson.loads(text) if backend == "orjson" else json.loads(text)
+    return validate(value, schema)
+
+
+def _finite(value):
+    """NaN/Infinity float를 None으로 바꾼 사본 (msgspec/orjson이 쓰는 것과 같은 null)"""
+    if type(value) is float:
+        return value if math.isfinite(value) else None
+    if type(value) is dict:
+        return {key: _finite(item) for key, item in value.items()}
+    if type(value) in (list, tuple):
+        return [_finite(item) for item in value]
+    return value
+
+
+def encode(value):
+    """값 -> 공백 없는 JSON 문자열 (비ASCII 문자는 그대로)"""
+    if backend == "msgspec":
+        return msgspec.json.encode(value).decode("utf-8")
+    if backend == "orjson":
+        return orjson.dumps(value).decode("utf-8")
+    try:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+    except ValueError:
+        # 표준 json은 NaN 리터럴을 쓰는데 다른 코덱은 그걸 못 읽으므로, 있을 때만 사본을 만들어 null로
+        return json.dumps(_finite(value), ensure_ascii=False, separators=(",", ":"))
+
+
+use_backend()
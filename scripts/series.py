@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+화면용 기간별 리베이스(%) 시계열 사전 계산
+
+브라우저가 상호작용마다 전체 가격 배열을 필터링/리베이스하지 않도록
+기간마다 "시작일 이후 첫 가격 대비 변동률(%)" 숫자 배열을 미리 만들어 둔다.
+
+    {
+      "dates": [...],                       # 가장 긴 기간의 시작일부터의 날짜 축
+      "periods": {"YTD": {"start": 172,     # dates 안에서 이 기간이 시작하는 위치
+                          "values": {"EURUSD=X": [0.0, -0.38, null, ...]}}}
+    }
+
+점 하나에 {i, y} 두 숫자가 들므로, 기간 길이가 화면 종류별 목표 점 개수
+(downsample.TARGET_POINTS)의 두 배를 넘을 때만 그 화면 종류를 다운샘플링한다
+(i는 start 기준 인덱스). 원본으로 보내는 화면 종류가 하나라도 있으면 "values"도 남는다.
+
+      "20Y": {"start": 0, "sampled": {"mobile": {"EURUSD=X": {"i": [0, 4, ...], "y": [0.0, 1.2, ...]}},
+                                      "desktop": {...}}}
+
+페이지/파일에는 screen_series로 화면 종류 하나만 골라 싣는다
+(기간마다 "values" 또는 그 화면의 "sampled": {심볼: {i, y}}).
+"""
+
+import base64
+
+import numpy as np
+
+from alignment import start_indices
+from downsample import FULL_RESOLUTION, METHODS, TARGET_POINTS
+from performance import DEFAULT_PERIODS, price_matrix, resolve_period, start_prices
+
+
+def _values(row):
+    return [None if np.isnan(v) else float(v) for v in row]
+
+
+def _sampled(symbols, rebased, targets, method):
+    sampled = {}
+    for screen, target in targets.items():
+        points = {}
+        for symbol, row in zip(symbols, rebased):
+            index = method(row, target)
+            if len(index):
+                points[symbol] = {"i": index.tolist(), "y": row[index].tolist()}
+        sampled[screen] = points
+    return sampled
+
+
+def rebased_series(dataset, periods=DEFAULT_PERIODS, today=None, targets=TARGET_POINTS,
+                   full_resolution=FULL_RESOLUTION, method="lttb"):
+    """컬럼형 dataset -> 기간별 리베이스 시계열 (빈 날은 None, 소수 둘째 자리)
+
+    targets가 None이면 다운샘플링 없이 모든 기간을 원본 해상도로 만든다.
+    """
+    dates, symbols, matrix = price_matrix(dataset)
+    starts = start_indices(dates, [resolve_period(period, today) for period in periods])
+    offset = int(starts.min()) if len(starts) else 0
+    base_prices = start_prices(matrix, starts)
+
+    result = {"dates": dataset["dates"][offset:], "periods": {}}
+    for column, (period, start) in enumerate(zip(periods, starts)):
+        window = matrix[:, start:]
+        base = base_prices[:, column:column + 1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rebased = np.round((window - base) / base * 100, 2)
+        entry = {"start": int(start) - offset}
+        # 점마다 {i, y} 두 숫자라 목표의 두 배 이하로 줄어들 때만 이득이다
+        screens = targets or {}
+        sample = {
+            screen: target for screen, target in screens.items()
+            if period not in full_resolution and window.shape[1] > 2 * target
+        }
+        if not screens or len(sample) < len(screens):
+            entry["values"] = {
+                symbol: _values(row)
+                for symbol, row in zip(symbols, rebased) if not np.isnan(row).all()
+            }
+        if sample:
+            entry["sampled"] = _sampled(symbols, rebased, sample, METHODS[method])
+        result["periods"][str(period)] = entry
+    return result
+
+
+def screen_series(series, screen):
+    """rebased_series 결과 -> 화면 종류 하나만 담은 사본 (기간마다 "values" 또는 그 화면의 "sampled")"""
+    periods = {}
+    for period, entry in series["periods"].items():
+        if screen in entry.get("sampled", {}):
+            periods[period] = {"start": entry["start"], "sampled": entry["sampled"][screen]}
+        else:
+            periods[period] = {"start": entry["start"], "values": entry["values"]}
+    return {"dates": series["dates"], "periods": periods}
+
+
+def subset_series(series, symbols):
+    """rebased_series 결과에서 일부 심볼만 남긴 사본 (다시 계산하지 않음)"""
+    keep = set(symbols)
+    periods = {}
+    for period, entry in series["periods"].items():
+        sliced = {"start": entry["start"]}
+        if "values" in entry:
+            sliced["values"] = {s: v for s, v in entry["values"].items() if s in keep}
+        if "sampled" in entry:
+            sliced["sampled"] = {
+                screen: {s: v for s, v in points.items() if s in keep}
+                for screen, points in entry["sampled"].items()
+            }
+        periods[period] = sliced
+    return {"dates": series["dates"], "periods": periods}
+
+
+def price_buffers(dataset, periods=DEFAULT_PERIODS, today=None):
+    """worker 모드 페이지용 바이너리 레이아웃
+
+    days: Int32 LE epoch-day 배열, prices: Float64 LE [심볼 x 날짜] 행렬 (빈 날은 NaN),
+    둘 다 base64. starts는 기간별 시작 epoch-day.
+    """
+    dates, symbols, matrix = price_matrix(dataset)
+    return {
+        "symbols": symbols,
+        "days": base64.b64encode(dates.astype(np.int64).astype("<i4").tobytes()).decode("ascii"),
+        "prices": base64.b64encode(matrix.astype("<f8").tobytes()).decode("ascii"),
+        "starts": {
+            str(period): int(np.datetime64(resolve_period(period, today), "D").astype(np.int64))
+            for period in periods
+        },
+    }
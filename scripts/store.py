@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+performance.json 컬럼형 저장 포맷
+
+예전 포맷은 봉마다 {"date": ..., "price": ...} dict를 반복했다.
+컬럼형(columnar-v1)은 날짜 축(alignment.master_calendar 영업일 달력)을 한 번만
+저장하고 심볼마다 그 축에 맞춘 가격 배열 하나를 둔다 (빠진 날은 null).
+
+    {
+      "format": "columnar-v1",
+      "lastUpdated": "2026-05-06 14:51",
+      "dates": ["2025-04-01", ...],
+      "assets": {"EURUSD=X": {"name": ..., "color": ..., "performance": {...},
+                              "prices": [1.0819, null, ...]}}
+    }
+
+봉 레코드에 종가 외 필드(open/high/low/volume)가 있으면 심볼마다
+"bars": {"open": [...], ...}로 같은 날짜 축에 맞춰 둔다.
+
+binary=True로 쓰면 가격 배열은 같은 이름의 .f32 사이드카
+(float32 little-endian, 심볼 순서대로 [심볼 x 날짜] 행렬, 빠진 날은 NaN)로
+빠지고 JSON에는 그 설명만 남는다. float32라 값은 차트용 정밀도(유효숫자 7자리)다.
+
+파일은 DatasetWriter가 심볼 하나를 한 줄로 써 나간다 (그래도 유효한 JSON). 파일 전체 문자열을
+한 번에 만들지 않을 뿐 쓰는 쪽의 컬럼형 dataset은 메모리에 다 있다 - 날짜 축과 크로스/상관이
+모든 심볼을 받은 뒤에야 정해지므로 fetch 루프에서 심볼마다 바로 쓰지는 않는다.
+
+    {"format":"columnar-v1","lastUpdated":"...","dates":[...],"assets":{
+    "EURUSD=X":{...}
+    ,"USDJPY=X":{...}
+    }
+    ,"crosses":{...}
+    ,"correlation":{...}
+    }
+
+메모리 절약은 읽는 쪽이다: iter_dataset은 이 레이아웃을 한 줄씩 읽어 심볼 하나씩 넘겨주므로
+파일 전체 문자열이나 전체 dict를 한 번에 만들지 않는다. 예전 포맷이나 한 줄짜리 파일은 통째로 읽어 같은 순서로 넘긴다.
+"""
+
+import math
+import os
+import sys
+from array import array
+from pathlib import Path
+from typing import Any
+
+from alignment import master_calendar
+from schema import Asset, Dataset, Header, LegacyDataset, decode, encode, validate
+
+FORMAT = "columnar-v1"
+ASSETS_OPEN = '"assets":{'
+
+
+def is_columnar(data):
+    return data.get("format") == FORMAT
+
+
+def build_columnar(last_updated, assets):
+    """{심볼: {name, color, prices: [{date, price}], performance}} -> 컬럼형 dataset"""
+    dates = master_calendar(p["date"] for info in assets.values() for p in info["prices"])
+    position = {date: i for i, date in enumerate(dates)}
+    columnar = {}
+    for symbol, info in assets.items():
+        column = [None] * len(dates)
+        bars = {}
+        for p in info["prices"]:
+            i = position[p["date"]]
+            column[i] = p["price"]
+            for field, value in p.items():
+                if field not in ("date", "price"):
+                    bars.setdefault(field, [None] * len(dates))[i] = value
+        columnar[symbol] = {key: value for key, value in info.items() if key != "prices"}
+        columnar[symbol]["prices"] = column
+        if bars:
+            columnar[symbol]["bars"] = bars
+    return {"format": FORMAT, "lastUpdated": last_updated, "dates": dates, "assets": columnar}
+
+
+def from_legacy(data):
+    """예전 list-of-dicts 포맷 dict를 컬럼형으로 변환"""
+    return build_columnar(data["lastUpdated"], data["assets"])
+
+
+def price_records(dataset, symbol):
+    """컬럼형 dataset에서 한 심볼을 예전 [{date, price}] 리스트로 꺼내기 (bars 필드가 있으면 같이)"""
+    info = dataset["assets"][symbol]
+    bars = info.get("bars", {})
+    return [
+        {"date": date, "price": price, **{field: column[i] for field, column in bars.items()}}
+        for i, (date, price) in enumerate(zip(dataset["dates"], info["prices"]))
+        if price is not None
+    ]
+
+
+def _sidecar_path(path):
+    return Path(path).with_suffix(".f32")
+
+
+def _write_sidecar(path, dataset):
+    values = array("f")
+    for info in dataset["assets"].values():
+        values.extend(math.nan if price is None else price for price in info["prices"])
+    if sys.byteorder != "little":
+        values.byteswap()
+    with open(path, "wb") as f:
+        values.tofile(f)
+
+
+def _sidecar_rows(path, binary):
+    """사이드카 [심볼 x 날짜] 행렬을 한 행씩 -> (심볼, 가격 리스트) 이터레이터 (한 행만 메모리에)"""
+    _, n_dates = binary["shape"]
+    with open(Path(path).parent / binary["file"], "rb") as f:
+        for symbol in binary["symbols"]:
+            values = array("f")
+            values.fromfile(f, n_dates)
+            if sys.byteorder != "little":
+                values.byteswap()
+            yield symbol, [None if math.isnan(price) else round(price, 4) for price in values]
+
+
+class DatasetWriter:
+    """performance.json 심볼별 한 줄 쓰기 (임시 파일에 쓰고 끝나면 교체)
+
+    인코딩 버퍼만 심볼 하나 크기일 뿐 넘기는 dataset은 호출하는 쪽이 이미 다 들고 있다.
+
+        with DatasetWriter(path, {"format": FORMAT, "lastUpdated": ..., "dates": [...]}) as writer:
+            for symbol, info in assets:
+                writer.write_asset(symbol, info)
+            writer.write_block("crosses", crosses)
+
+    헤더(header)는 assets보다 앞에, write_block으로 쓴 블록은 assets 뒤에 온다.
+    """
+
+    def __init__(self, path, header):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        self._file = open(self._tmp, "w", encoding="utf-8")
+        self._first = True
+        self._assets_open = True
+        head = encode(header)
+        self._file.write(head[:-1] + ("," if header else "") + ASSETS_OPEN + "\n")
+
+    def write_asset(self, symbol, info):
+        if not self._assets_open:
+            raise ValueError("assets 뒤에 블록을 쓴 다음에는 심볼을 더 쓸 수 없음")
+        self._file.write(("" if self._first else ",") + encode(symbol) + ":" + encode(info) + "\n")
+        self._first = False
+
+    def write_block(self, key, value):
+        if self._assets_open:
+            self._file.write("}\n")
+            self._assets_open = False
+        self._file.write("," + encode(key) + ":" + encode(value) + "\n")
+
+    def close(self):
+        if self._assets_open:
+            self._file.write("}\n")
+            self._assets_open = False
+        self._file.write("}\n")
+        self._file.close()
+        os.replace(self._tmp, self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._file.close()
+            self._tmp.unlink(missing_ok=True)
+
+
+def write_dataset(path, dataset, binary=False):
+    """컬럼형 dataset 저장 (binary=True면 가격은 .f32 사이드카로)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    header = {key: value for key, value in dataset.items() if key in ("format", "lastUpdated", "dates")}
+    if binary:
+        sidecar = _sidecar_path(path)
+        _write_sidecar(sidecar, dataset)
+        header["binary"] = {
+            "file": sidecar.name,
+            "dtype": "<f4",
+            "shape": [len(dataset["assets"]), len(dataset["dates"])],
+            "symbols": list(dataset["assets"]),
+        }
+    with DatasetWriter(path, header) as writer:
+        for symbol, info in dataset["assets"].items():
+            if binary:
+                info = {key: value for key, value in info.items() if key != "prices"}
+            writer.write_asset(symbol, info)
+        for key, value in dataset.items():
+            if key not in header and key != "assets":
+                writer.write_block(key, value)
+
+
+def _iter_whole(path, data):
+    """통째로 읽은 dict를 iter_dataset과 같은 (구역, 키, 값) 순서로"""
+    if not is_columnar(data):
+        data = from_legacy(validate(data, LegacyDataset))
+    else:
+        data = validate(data, Dataset)
+    yield "header", None, {key: value for key, value in data.items() if key in ("format", "lastUpdated", "dates", "binary")}
+    prices = dict(_sidecar_rows(path, data["binary"])) if "binary" in data else {}
+    for symbol, info in data["assets"].items():
+        if symbol in prices:
+            info["prices"] = prices.pop(symbol)
+        yield "asset", symbol, info
+    for key, value in data.items():
+        if key not in ("format", "lastUpdated", "dates", "binary", "assets"):
+            yield "block", key, value
+
+
+def iter_dataset(path):
+    """performance.json을 한 줄씩 읽어 ("header", None, {...}) -> ("asset", 심볼, info)... -> ("block", 키, 값)...
+
+    바이너리 사이드카면 심볼마다 가격 행을 읽어 info["prices"]에 채워 넘긴다.
+    DatasetWriter 레이아웃이 아니면(예전 포맷 등) 통째로 읽어 같은 순서로 넘긴다.
+    줄마다 schema로 디코드하므로 모양이 틀리면 그 줄에서 SchemaError.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        first = f.readline()
+        if not first.rstrip("\n").endswith(ASSETS_OPEN):
+            yield from _iter_whole(path, decode(first + f.read()))
+            return
+        head = first.rstrip("\n")[:-len(ASSETS_OPEN)].rstrip(",")
+        header = decode(head + "}", Header)
+        yield "header", None, header
+        rows = _sidecar_rows(path, header["binary"]) if "binary" in header else None
+        for line in f:
+            line = line.rstrip("\n")
+            if line == "}":
+                break
+            ((symbol, info),) = decode("{" + line.lstrip(",") + "}", dict[str, Asset]).items()
+            if rows is not None:
+                row_symbol, info["prices"] = next(rows)
+                if row_symbol != symbol:
+                    raise ValueError(f"사이드카 심볼 순서가 다름: {row_symbol} != {symbol}")
+            yield "asset", symbol, info
+        for line in f:
+            line = line.rstrip("\n")
+            if line == "}":
+                break
+            ((key, value),) = decode("{" + line.lstrip(",") + "}", dict[str, Any]).items()
+            yield "block", key, value
+
+
+def load_dataset(path):
+    """예전/컬럼형/바이너리 사이드카 어느 포맷이든 컬럼형 dataset으로 읽기"""
+    data = {}
+    for section, key, value in iter_dataset(path):
+        if section == "header":
+            data.update(value)
+            data.pop("binary", None)
+            data["assets"] = {}
+        elif section == "asset":
+            data["assets"][key] = value
+        else:
+            data[key] = value
+    return data
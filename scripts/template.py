@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+페이지 템플릿 컴파일 + 렌더링
+
+templates/ 안의 파일은 {{ 이름 }} 자리표시자만 쓰는 평범한 HTML이다
+(CSS/JS 중괄호를 두 번 쓸 필요 없음). 파일은 처음 쓸 때 한 번만 읽어
+[문자열, 이름, 문자열, 이름, ...] 조각 리스트로 컴파일해 두고,
+렌더링은 조각을 이어 붙이기만 한다.
+"""
+
+import re
+from pathlib import Path
+
+TEMPLATE_DIR = Path(__file__).parent / "templates"
+
+_PLACEHOLDER = re.compile(r"\{\{\s*([a-z_]+)\s*\}\}")
+_compiled = {}
+
+
+class CompiledTemplate:
+    def __init__(self, source):
+        parts = _PLACEHOLDER.split(source)
+        self.literals = parts[0::2]
+        self.names = parts[1::2]
+
+    def render(self, context):
+        try:
+            values = [str(context[name]) for name in self.names]
+        except KeyError as e:
+            raise KeyError(f"템플릿 값 없음: {e.args[0]}") from None
+        out = [self.literals[0]]
+        for value, literal in zip(values, self.literals[1:]):
+            out.append(value)
+            out.append(literal)
+        return "".join(out)
+
+
+def load_template(name):
+    """컴파일된 템플릿 (파일이 바뀌면 다시 컴파일)"""
+    path = TEMPLATE_DIR / name
+    mtime = path.stat().st_mtime_ns
+    cached = _compiled.get(name)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, CompiledTemplate(path.read_text(encoding="utf-8")))
+        _compiled[name] = cached
+    return cached[1]
+
+
+def render(name, context):
+    return load_template(name).render(context)